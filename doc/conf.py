@@ -2,10 +2,10 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import datetime
+import os
 import pathlib
-import time
-
-from importlib.metadata import distribution
+import sys
 
 # -- General configuration -----------------------------------------------------
 
@@ -32,17 +32,17 @@ extensions = [
 nitpicky = True
 
 # Ignores stuff we can't easily resolve on other project's sphinx manuals
-nitpick_ignore = []
+nitpick_ignore: list[tuple[str, str]] = []
 
-# Allows the user to override warnings from a separate file
+# Allows the user to override warnings from a separate file.  Set
+# SPHINX_SKIP_NITPICK to a non-empty value to skip reading it.
 nitpick_path = pathlib.Path("nitpick-exceptions.txt")
-if nitpick_path.exists():
-    for line in nitpick_path.open():
-        if line.strip() == "" or line.startswith("#"):
-            continue
-        dtype, target = line.split(None, 1)
-        target = target.strip()
-        nitpick_ignore.append((dtype, target))
+if not os.environ.get("SPHINX_SKIP_NITPICK") and nitpick_path.exists():
+    nitpick_ignore.extend(
+        (parts[0], parts[1].strip())
+        for parts in (k.split(None, 1) for k in nitpick_path.read_text().splitlines())
+        if len(parts) == 2 and not parts[0].startswith("#")
+    )
 
 # Always includes todos
 todo_include_todos = True
@@ -54,9 +54,10 @@ autosummary_generate = True
 numfig = True
 
 # If we are on OSX, the 'dvipng' path maybe different
-dvipng_osx = pathlib.Path("/Library/TeX/texbin/dvipng")
-if dvipng_osx.exists():
-    pngmath_dvipng = dvipng_osx
+if sys.platform == "darwin":
+    dvipng_osx = pathlib.Path("/Library/TeX/texbin/dvipng")
+    if dvipng_osx.exists():
+        pngmath_dvipng = dvipng_osx
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
@@ -69,9 +70,21 @@ master_doc = "index"
 
 # General information about the project.
 project = "clapper"
+
+from importlib.metadata import distribution
+
 package = distribution(project)
+package_metadata = package.metadata
+
+# Honour SOURCE_DATE_EPOCH for reproducible builds
+if "SOURCE_DATE_EPOCH" in os.environ:
+    _build_date = datetime.datetime.fromtimestamp(
+        int(os.environ["SOURCE_DATE_EPOCH"]), tz=datetime.timezone.utc
+    )
+else:
+    _build_date = datetime.datetime.now()
 
-copyright = f"{time.strftime('%Y')}, Idiap Research Institute"  # noqa: A001
+copyright = f"{_build_date.year}, Idiap Research Institute"  # noqa: A001
 
 # The short X.Y version.
 version = package.version
@@ -91,8 +104,8 @@ pygments_dark_style = "monokai"
 
 # Some variables which are useful for generated material
 project_variable = project.replace(".", "_")
-short_description = package.metadata["Summary"]
-owner = ["Idiap Research Institute"]
+short_description = package_metadata["Summary"]
+owner = ("Idiap Research Institute",)
 
 # -- Options for HTML output ---------------------------------------------------
 
@@ -119,7 +132,7 @@ auto_intersphinx_packages = [("python", "3"), "click"]
 auto_intersphinx_catalog = "catalog.json"
 
 # Doctest global setup
-sphinx_source_dir = pathlib.Path.cwd().resolve()
+sphinx_source_dir = pathlib.Path(__file__).resolve().parent
 doctest_global_setup = f"""
 import os
 data = os.path.join('{sphinx_source_dir}', 'data')
@@ -7,12 +7,16 @@
 # essential packages needed to start the CLI.  Defer all other imports to
 # within the function implementing the command.
 
+import logging
+
 import click
 
 from clapper.click import ConfigCommand, ResourceOption, verbosity_option
-from clapper.logging import setup
 
-logger = setup(__name__.split(".", 1)[0])
+# console handlers are only attached to this logger when the script runs
+logger = logging.getLogger(__name__.partition(".")[0])
+
+COLOR_CHOICES = click.Choice(("red", "green", "blue"))
 
 
 @click.command(
@@ -21,7 +25,8 @@ logger = setup(__name__.split(".", 1)[0])
         "help_option_names": ["-?", "-h", "--help"],
     },
     # if configuration 'modules' must be loaded from package entry-points,
-    # then must search this entry-point group:
+    # then must search this entry-point group.  Entry-points are only
+    # scanned when configuration arguments are passed on the command-line:
     entry_point_group="test.app",
     cls=ConfigCommand,
     epilog="""\b
@@ -35,7 +40,7 @@ Examples:
 @click.option("--str", default="foo", cls=ResourceOption)
 @click.option(
     "--choice",
-    type=click.Choice(["red", "green", "blue"]),
+    type=COLOR_CHOICES,
     cls=ResourceOption,
 )
 @verbosity_option(logger=logger)
@@ -47,11 +52,17 @@ def main(ctx, **_):
 
     # In this example, we just print the loaded options to demonstrate loading
     # from config files actually works!
-    for k, v in ctx.params.items():
-        if k in ("dump_config", "config"):
-            continue
-        click.echo(f"{k}: {v}")
+    click.echo(
+        "\n".join(
+            f"{k}: {v}"
+            for k, v in ctx.params.items()
+            if k not in ("dump_config", "config")
+        )
+    )
 
 
 if __name__ == "__main__":
+    from clapper.logging import setup
+
+    setup(logger.name)
     main()
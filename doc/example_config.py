@@ -2,10 +2,12 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
+
 from clapper.click import config_group
-from clapper.logging import setup
 
-logger = setup(__name__.split(".", 1)[0])
+# console handlers are only attached to this logger when the script runs
+logger = logging.getLogger(__name__.partition(".")[0])
 
 
 @config_group(logger=logger, entry_point_group="clapper.test.config")
@@ -15,4 +17,7 @@ def main(**kwargs):
 
 
 if __name__ == "__main__":
+    from clapper.logging import setup
+
+    setup(logger.name)
     main()
@@ -2,11 +2,13 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
+
 from clapper.click import user_defaults_group
-from clapper.logging import setup
 from clapper.rc import UserDefaults
 
-logger = setup(__name__.split(".", 1)[0])
+# console handlers are only attached to this logger when the script runs
+logger = logging.getLogger(__name__.partition(".")[0])
 rc = UserDefaults("myapp.toml", logger=logger)
 
 
@@ -17,4 +19,7 @@ def main(**kwargs):
 
 
 if __name__ == "__main__":
+    from clapper.logging import setup
+
+    setup(logger.name)
     main()
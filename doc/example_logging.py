@@ -6,6 +6,6 @@ import logging
 
 from clapper.logging import setup
 
-logger = setup(__name__.split(".", 1)[0], format="%(levelname)s: %(message)s")
+logger = setup(__name__.partition(".")[0], format="%(levelname)s: %(message)s")
 logger.setLevel(logging.INFO)
 logger.info("test message")
@@ -5,23 +5,20 @@
 
 """Helpers to build command-line interfaces (CLI) via :py:mod:`click`."""
 
+import bisect
 import functools
-import inspect
 import logging
-import pathlib
-import pprint
-import shutil
+import re
 import time
 import typing
 
 from importlib.metadata import EntryPoint
 
 import click
-import tomli
 
 from click.core import ParameterSource
 
-from .config import load, mod_to_context, resource_keys
+from .config import _group_entry_points, load, mod_to_context, resource_keys
 from .rc import UserDefaults
 
 module_logger = logging.getLogger(__name__)
@@ -30,6 +27,21 @@ module_logger = logging.getLogger(__name__)
 _COMMON_CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 """Common click context settings."""
 
+_VERBOSITY_LEVELS = (logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG)
+"""Log-levels set by :py:func:`verbosity_option`, indexed by verbosity."""
+
+_VERBOSITY_HELP = (
+    "Increase the verbosity level from 0 (only error and critical) "
+    "messages will be displayed, to 1 (like 0, but adds warnings), 2 "
+    "(like 1, but adds info messages), and 3 (like 2, but also adds "
+    "debugging messages) by adding the --{name} option as often as "
+    "desired (e.g. '-vvv' for debug)."
+)
+"""Help message template for :py:func:`verbosity_option`."""
+
+_HELP_REQUESTED_KEY = "clapper.click.help_requested"
+"""Key set in ``ctx.meta`` if :py:class:`ConfigCommand` help was requested."""
+
 
 def verbosity_option(
     logger: logging.Logger,
@@ -88,15 +100,12 @@ def verbosity_option(
         option decorators.  Use it accordingly.
     """
 
+    help_text = _VERBOSITY_HELP.format(name=name)
+
     def custom_verbosity_option(f):
         def callback(ctx, param, value):
             ctx.meta[name] = value
-            log_level: int = {  # type: ignore
-                0: logging.ERROR,
-                1: logging.WARNING,
-                2: logging.INFO,
-                3: logging.DEBUG,
-            }[value]
+            log_level = _VERBOSITY_LEVELS[value]
 
             logger.setLevel(log_level)
             logger.debug(f'Level of Logger("{logger.name}") was set to {log_level}')
@@ -109,13 +118,7 @@ def verbosity_option(
             type=click.IntRange(min=0, max=3, clamp=True),
             default=dflt,
             show_default=True,
-            help=(
-                f"Increase the verbosity level from 0 (only error and critical) "
-                f"messages will be displayed, to 1 (like 0, but adds warnings), 2 "
-                f"(like 1, but adds info messages), and 3 (like 2, but also adds "
-                f"debugging messages) by adding the --{name} option as often as "
-                f"desired (e.g. '-vvv' for debug)."
-            ),
+            help=help_text,
             callback=callback,
             is_eager=kwargs.get("cls", None) is not ResourceOption,
             **kwargs,
@@ -175,6 +178,11 @@ will override the values of configuration files. You can run this command with
 
         # Add the config argument to the command
         def configs_argument_callback(ctx, param, value):
+            if ctx.meta.get(_HELP_REQUESTED_KEY):
+                # the help option exits before config values are used
+                ctx.config_context = {}
+                return value
+
             config_context = load(value, entry_point_group=self.entry_point_group)
 
             config_context = mod_to_context(config_context)
@@ -199,6 +207,24 @@ will override the values of configuration files. You can run this command with
             callback=self.dump_config,
         )(self)
 
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Parse arguments, noting if help was requested before loading configs.
+
+        Config files are eagerly loaded by the ``CONFIG`` argument callback,
+        which may run before the help option if configs are given first on the
+        command line.
+        """
+        help_option = self.get_help_option(ctx)
+        try:
+            opts, _, _ = self.make_parser(ctx).parse_args(args=list(args))
+        except click.UsageError:
+            # reported when arguments are actually parsed below
+            opts = {}
+        ctx.meta[_HELP_REQUESTED_KEY] = (
+            help_option is not None and help_option.name in opts
+        )
+        return super().parse_args(ctx, args)
+
     def dump_config(
         self,
         ctx: typing.Any,
@@ -219,29 +245,37 @@ will override the values of configuration files. You can run this command with
         if config_file is None:
             return
 
+        # options may share the same entry-point group: only scan it once
+        entry_point_keys = functools.cache(resource_keys)
+
         module_logger.debug(f"Generating configuration file `{config_file}'...")
-        config_file.write('"""')
-        config_file.write(
-            f"Configuration file automatically generated at "
-            f"{time.strftime('%d/%m/%Y')}.\n\n{ctx.command_path}\n"
+        # contents are accumulated and written to the file at once
+        contents: list[str] = []
+        write = contents.append
+
+        date = time.strftime("%d/%m/%Y")
+        write(
+            f'"""Configuration file automatically generated at {date}.\n\n'
+            f"{ctx.command_path}\n"
         )
 
         if self.help:
-            h = self.help.replace(self.extra_help, "").replace("\b\n", "")
-            config_file.write(f"\n{h.rstrip()}")
+            help_clean = self.help.replace(self.extra_help, "").replace("\b\n", "")
+            write(f"\n{help_clean.rstrip()}")
 
         if self.epilog:
-            config_file.write("\n\n{}".format(self.epilog.replace("\b\n", "")))
+            epilog_clean = self.epilog.replace("\b\n", "")
+            write(f"\n\n{epilog_clean}")
 
-        config_file.write('\n"""\n')
+        write('\n"""\n')
 
         for param in self.params:
             if not isinstance(param, ResourceOption):
                 # we can only handle ResourceOptions
                 continue
 
-            config_file.write(f"\n# {param.name} = {str(param.default)}\n")
-            config_file.write('"""')
+            write(f"\n# {param.name} = {str(param.default)}\n")
+            write('"""')
 
             if param.required:
                 begin, dflt = "Required parameter", ""
@@ -251,21 +285,23 @@ will override the values of configuration files. You can run this command with
                     f" [default: {param.default}]",
                 )
 
-            config_file.write(f"{begin}: {param.name} ({', '.join(param.opts)}){dflt}")
+            write(f"{begin}: {param.name} ({', '.join(param.opts)}){dflt}")
 
             if param.help is not None:
-                config_file.write(f"\n{param.help}")
+                write(f"\n{param.help}")
 
             if (
                 isinstance(param, ResourceOption)
                 and param.entry_point_group is not None
             ):
-                config_file.write(
+                write(
                     f"\nRegistered entries are: "
-                    f"{resource_keys(param.entry_point_group)}"
+                    f"{entry_point_keys(param.entry_point_group)}"
                 )
 
-            config_file.write('"""\n')
+            write('"""\n')
+
+        config_file.write("".join(contents))
 
         click.echo(f"Configuration file `{config_file.name}' was written; exiting")
 
@@ -405,7 +441,8 @@ class ResourceOption(click.Option):
             it used to retrieve it.
         """
 
-        if (not hasattr(ctx, "config_context")) and self.entry_point_group is None:
+        config_context = getattr(ctx, "config_context", None)
+        if config_context is None and self.entry_point_group is None:
             raise TypeError(
                 "The ResourceOption class is not meant to be used this way. "
                 "See package documentation for details."
@@ -413,31 +450,27 @@ class ResourceOption(click.Option):
 
         module_logger.debug(f"consuming resource option for {self.name}")
         value = opts.get(self.name)
-        source = ParameterSource.COMMANDLINE
+        if value is not None:
+            return value, ParameterSource.COMMANDLINE
 
         # if value is not given from command line, lookup the config files given as
-        # arguments (not options).
-        if value is None:
-            # if this class is used with the ConfigCommand class. This is not always
-            # true.
-            if hasattr(ctx, "config_context"):
-                value = ctx.config_context.get(self.name)
+        # arguments (not options), if this class is used with the ConfigCommand
+        # class. This is not always true.
+        if (
+            config_context is not None
+            and (value := config_context.get(self.name)) is not None
+        ):
+            return value, ParameterSource.COMMANDLINE
 
         # if not from config files, lookup the environment variables
-        if value is None:
-            value = self.value_from_envvar(ctx)
-            source = ParameterSource.ENVIRONMENT
+        if (value := self.value_from_envvar(ctx)) is not None:
+            return value, ParameterSource.ENVIRONMENT
 
         # if not from environment variables, lookup the default value
-        if value is None:
-            value = ctx.lookup_default(self.name)
-            source = ParameterSource.DEFAULT_MAP
-
-        if value is None:
-            value = self.get_default(ctx)
-            source = ParameterSource.DEFAULT
+        if (value := ctx.lookup_default(self.name)) is not None:
+            return value, ParameterSource.DEFAULT_MAP
 
-        return value, source
+        return self.get_default(ctx), ParameterSource.DEFAULT
 
     def type_cast_value(self, ctx: click.Context, value: typing.Any) -> typing.Any:
         """Convert and validate a value against the option's type.
@@ -461,7 +494,13 @@ class ResourceOption(click.Option):
 
         # if the value is a string and an entry_point_group is provided, load it
         if self.entry_point_group is not None:
+            seen: set[str] = set()
             while isinstance(value, str) and value not in self.string_exceptions:
+                if value in seen:
+                    raise click.BadParameter(
+                        f"resource `{value}' refers back to itself", ctx, self
+                    )
+                seen.add(value)
                 value = load(
                     [value],
                     entry_point_group=self.entry_point_group,
@@ -498,6 +537,210 @@ class AliasedGroup(click.Group):
         ctx.fail(f"Too many matches: {', '.join(sorted(matches))}")  # noqa: RET503
 
 
+class LazyGroup(AliasedGroup):
+    """An :py:class:`AliasedGroup` that builds subcommands on demand.
+
+    Subcommands registered through ``lazy_subcommands`` are only built (and
+    added to the group) the first time they are looked up.  This avoids
+    building all subcommands of a group when just one of them is called.
+
+
+    Arguments:
+
+        *args: Unnamed parameters passed to :py:class:`AliasedGroup`
+
+        lazy_subcommands: A dictionary mapping subcommand names to callables
+            that take no arguments and return the :py:class:`click.Command`
+            to be registered under that name
+
+        **kwargs: Named parameters passed to :py:class:`AliasedGroup`
+    """
+
+    lazy_subcommands: dict[str, typing.Callable[[], click.Command]]
+    """Subcommands that have not been built yet, and their builders."""
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        lazy_subcommands: dict[str, typing.Callable[[], click.Command]] | None = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx):
+        """List both built and yet-to-be-built subcommands."""
+        return sorted({*self.commands, *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        """get_command building lazy subcommands on demand."""
+        if cmd_name in self.lazy_subcommands:
+            candidates = [cmd_name]
+        else:  # any of these could be picked by prefix aliasing
+            candidates = [k for k in self.lazy_subcommands if k.startswith(cmd_name)]
+        for name in candidates:
+            self.add_command(self.lazy_subcommands.pop(name)(), name)
+        return super().get_command(ctx, cmd_name)
+
+
+def _build_show(
+    config: UserDefaults,
+    verbosity: typing.Callable[..., typing.Any],
+) -> click.Command:
+    """Build the ``show`` subcommand of :py:func:`user_defaults_group`."""
+
+    @click.command(context_settings=_COMMON_CONTEXT_SETTINGS)
+    @verbosity
+    def show(**_: typing.Any) -> None:
+        """Show the user-defaults file contents."""
+        click.echo(str(config).strip())
+
+    return show
+
+
+def _build_get(
+    config: UserDefaults,
+    verbosity: typing.Callable[..., typing.Any],
+) -> click.Command:
+    """Build the ``get`` subcommand of :py:func:`user_defaults_group`."""
+
+    @click.command(
+        no_args_is_help=True,
+        context_settings=_COMMON_CONTEXT_SETTINGS,
+    )
+    @click.argument("key")
+    @verbosity
+    def get(key: str, **_: typing.Any) -> None:
+        """Print a key from the user-defaults file.
+
+        Retrieves the value of the requested KEY and displays it. The KEY
+        may contain dots (``.``) to access values from subsections in the
+        TOML_ document.
+        """
+        try:
+            click.echo(config[key])
+        except KeyError:
+            raise click.ClickException(
+                f"Cannot find object named `{key}' at `{config.path}'",
+            )
+
+    return get
+
+
+_TOML_BOOLEANS = {"true": True, "false": False}
+"""TOML boolean literals."""
+
+_TOML_DECIMAL = re.compile(
+    r"[+-]?(?:0|[1-9][0-9]*)(?P<fraction>\.[0-9]+)?(?P<exponent>[eE][+-]?[0-9]+)?"
+)
+"""Decimal numbers that are parsed the same way by Python and TOML."""
+
+
+def _parse_toml_value(value: str) -> typing.Any:
+    """Parse a value given on the command-line following the rules of TOML.
+
+    Booleans and plain decimal numbers are converted directly.  Other values
+    are parsed with :py:mod:`tomli`, and are kept as strings if they are not
+    valid TOML values.
+    """
+    if value in _TOML_BOOLEANS:
+        return _TOML_BOOLEANS[value]
+
+    match = _TOML_DECIMAL.fullmatch(value)
+    if match is not None:
+        if match["fraction"] is None and match["exponent"] is None:
+            return int(value)
+        return float(value)
+
+    import tomli
+
+    try:
+        return tomli.loads(f"v = {value}")["v"]
+    except tomli.TOMLDecodeError:
+        return value
+
+
+def _build_set(
+    logger: logging.Logger,
+    config: UserDefaults,
+    verbosity: typing.Callable[..., typing.Any],
+) -> click.Command:
+    """Build the ``set`` subcommand of :py:func:`user_defaults_group`."""
+
+    @click.command(
+        name="set",
+        no_args_is_help=True,
+        context_settings=_COMMON_CONTEXT_SETTINGS,
+    )
+    @click.argument("key")
+    @click.argument("value")
+    @verbosity
+    def set_(key: str, value: str, **_: typing.Any) -> None:
+        """Set the value for a key on the user-defaults file.
+
+        If ``key`` contains dots (``.``), then this sets nested subsection
+        variables on the configuration file.  Values are parsed and
+        translated following the rules of TOML_.
+
+        .. warning::
+
+           This command will override the current configuration file and my
+           erase any user comments added by hand.  To avoid this, simply
+           edit your configuration file by hand.
+        """
+        try:
+            config[key] = _parse_toml_value(value)
+            config.write()
+        except KeyError:
+            logger.error(
+                f"Cannot set object named `{key}' at `{config.path}'",
+                exc_info=True,
+            )
+            raise click.ClickException(
+                f"Cannot set object named `{key}' at `{config.path}'",
+            )
+
+    return set_
+
+
+def _build_rm(
+    logger: logging.Logger,
+    config: UserDefaults,
+    verbosity: typing.Callable[..., typing.Any],
+) -> click.Command:
+    """Build the ``rm`` subcommand of :py:func:`user_defaults_group`."""
+
+    @click.command(no_args_is_help=True, context_settings=_COMMON_CONTEXT_SETTINGS)
+    @click.argument("key")
+    @verbosity
+    def rm(key: str, **_: typing.Any) -> None:
+        """Remove the given key from the configuration file.
+
+        This command will remove the KEY from the configuration file.  If
+        the input key corresponds to a section in the configuration file,
+        then the whole configuration section will be removed.
+
+        .. warning::
+
+           This command will override the current configuration file and my
+           erase any user comments added by hand.  To avoid this, simply
+           edit your configuration file by hand.
+        """
+        try:
+            del config[key]
+            config.write()
+        except KeyError:
+            logger.error(
+                f"Cannot delete object named `{key}' at `{config.path}'",
+                exc_info=True,
+            )
+            raise click.ClickException(
+                f"Cannot delete object named `{key}' at `{config.path}'",
+            )
+
+    return rm
+
+
 def user_defaults_group(
     logger: logging.Logger,
     config: UserDefaults,
@@ -531,119 +774,235 @@ def user_defaults_group(
 
        $ user-cli rc --help
        usage: ...
+
+    Subcommands are only built when they are first required (see
+    :py:class:`LazyGroup`).
     """
 
     def group_decorator(
         func: typing.Callable[..., typing.Any],
     ) -> typing.Callable[..., typing.Any]:
+        # the same decorator is shared by the group and all its subcommands
+        verbosity = verbosity_option(logger=logger)
+
         @click.group(
-            cls=AliasedGroup,
+            cls=LazyGroup,
+            lazy_subcommands={
+                "show": functools.partial(_build_show, config, verbosity),
+                "get": functools.partial(_build_get, config, verbosity),
+                "set": functools.partial(_build_set, logger, config, verbosity),
+                "rm": functools.partial(_build_rm, logger, config, verbosity),
+            },
             no_args_is_help=True,
             context_settings=_COMMON_CONTEXT_SETTINGS,
         )
-        @verbosity_option(logger=logger)
+        @verbosity
         @functools.wraps(func)
         def group_wrapper(**kwargs):
             return func(**kwargs)
 
-        @group_wrapper.command(context_settings=_COMMON_CONTEXT_SETTINGS)
-        @verbosity_option(logger=logger)
-        def show(**_: typing.Any) -> None:
-            """Show the user-defaults file contents."""
-            click.echo(str(config).strip())
+        return group_wrapper
 
-        @group_wrapper.command(
-            no_args_is_help=True,
-            context_settings=_COMMON_CONTEXT_SETTINGS,
-        )
-        @click.argument("key")
-        @verbosity_option(logger=logger)
-        def get(key: str, **_: typing.Any) -> None:
-            """Print a key from the user-defaults file.
-
-            Retrieves the value of the requested KEY and displays it. The KEY
-            may contain dots (``.``) to access values from subsections in the
-            TOML_ document.
-            """
-            try:
-                click.echo(config[key])
-            except KeyError:
-                raise click.ClickException(
-                    f"Cannot find object named `{key}' at `{config.path}'",
-                )
+    return group_decorator
 
-        @group_wrapper.command(
-            name="set",
-            no_args_is_help=True,
-            context_settings=_COMMON_CONTEXT_SETTINGS,
-        )
-        @click.argument("key")
-        @click.argument("value")
-        @verbosity_option(logger=logger)
-        def set_(key: str, value: str, **_: typing.Any) -> None:
-            """Set the value for a key on the user-defaults file.
-
-            If ``key`` contains dots (``.``), then this sets nested subsection
-            variables on the configuration file.  Values are parsed and
-            translated following the rules of TOML_.
-
-            .. warning::
-
-               This command will override the current configuration file and my
-               erase any user comments added by hand.  To avoid this, simply
-               edit your configuration file by hand.
-            """
-            try:
-                tmp = tomli.loads(f"v = {value}")
-                value = tmp["v"]
-            except tomli.TOMLDecodeError:
-                pass
-
-            try:
-                config[key] = value
-                config.write()
-            except KeyError:
-                logger.error(
-                    f"Cannot set object named `{key}' at `{config.path}'",
-                    exc_info=True,
-                )
-                raise click.ClickException(
-                    f"Cannot set object named `{key}' at `{config.path}'",
-                )
 
-        @group_wrapper.command(
-            no_args_is_help=True, context_settings=_COMMON_CONTEXT_SETTINGS
-        )
-        @click.argument("key")
-        @verbosity_option(logger=logger)
-        def rm(key: str, **_: typing.Any) -> None:
-            """Remove the given key from the configuration file.
-
-            This command will remove the KEY from the configuration file.  If
-            the input key corresponds to a section in the configuration file,
-            then the whole configuration section will be removed.
-
-            .. warning::
-
-               This command will override the current configuration file and my
-               erase any user comments added by hand.  To avoid this, simply
-               edit your configuration file by hand.
-            """
-            try:
-                del config[key]
-                config.write()
-            except KeyError:
-                logger.error(
-                    f"Cannot delete object named `{key}' at `{config.path}'",
-                    exc_info=True,
-                )
-                raise click.ClickException(
-                    f"Cannot delete object named `{key}' at `{config.path}'",
+def _entry_points(group: str) -> dict[str, EntryPoint]:
+    """Return the entry-points registered on a group, indexed by name."""
+    return {e.name: e for e in _group_entry_points(group)}
+
+
+def _build_list(
+    logger: logging.Logger,
+    entry_point_group: str,
+    verbosity: typing.Callable[..., typing.Any],
+) -> click.Command:
+    """Build the ``list`` subcommand of :py:func:`config_group`."""
+
+    @click.command(
+        name="list",
+        context_settings=_COMMON_CONTEXT_SETTINGS,
+    )
+    @click.pass_context
+    @verbosity
+    def list_(ctx, **_: typing.Any):
+        """List installed configuration resources."""
+        import inspect
+        import reprlib
+
+        entry_points = _entry_points(entry_point_group)
+
+        # note: ep.module does not exist on Python < 3.9
+        ep_modules = {
+            name: ep.value.split(":", 1)[0] for name, ep in entry_points.items()
+        }
+
+        # all modules with configuration resources, keeping only the shortest
+        # prefixes.  Once sorted, names starting with a kept prefix directly
+        # follow it, so it is enough to compare against the last one kept.
+        keep_modules: list[str] = []
+        for k in sorted({v.rsplit(".", 1)[0] for v in ep_modules.values()}):
+            if not keep_modules or not k.startswith(keep_modules[-1]):
+                keep_modules.append(k)
+
+        # sort data entries by originating module: kept prefixes are not
+        # prefixes of each other, so the one matching a module is the closest
+        # that sorts before it
+        entry_points_by_module: dict[str, list[str]] = {k: [] for k in keep_modules}
+        for name, module in ep_modules.items():
+            k = keep_modules[bisect.bisect_right(keep_modules, module) - 1]
+            entry_points_by_module[k].append(name)
+
+        verbose = max(ctx.parent.params["verbose"], ctx.params["verbose"])
+
+        # summaries are truncated to a line anyway, so representations of
+        # objects are bounded in size
+        short_repr = reprlib.Repr()
+        short_repr.maxstring = short_repr.maxother = 75
+
+        for config_type, names in entry_points_by_module.items():
+            # calculates the longest config name so we offset the printing
+            longest_name_length = max(len(k) for k in names)
+
+            # 79 - 4 spaces = 75 (see the printed lines below)
+            description_leftover = 75 - longest_name_length
+
+            click.echo(f"module: {config_type}")
+            for name in sorted(names):
+                ep = entry_points[name]
+
+                if verbose >= 1:
+                    try:
+                        obj = ep.load()
+
+                        if ":" in ep.value:  # it's an object
+                            summary = f"[{type(obj).__name__}] {short_repr.repr(obj)}"
+                            summary = summary.replace("\n", " ")
+                        else:  # it's a whole module
+                            summary = "[module] "
+                            doc = inspect.getdoc(obj)
+                            if doc is not None:
+                                summary += doc.split("\n\n")[0]
+                                summary = summary.replace("\n", " ")
+                            else:
+                                summary += "[undocumented]"
+
+                    except Exception as ex:
+                        summary = "(cannot be loaded; add another -v for details)"
+                        if verbose >= 2:
+                            logger.exception(ex)
+
+                else:
+                    summary = ""
+
+                summary = (
+                    (summary[: (description_leftover - 3)] + "...")
+                    if len(summary) > (description_leftover - 3)
+                    else summary
                 )
 
-        return group_wrapper
+                click.echo(f"    {name.ljust(longest_name_length)}   {summary}")
 
-    return group_decorator
+    return list_
+
+
+def _build_describe(
+    logger: logging.Logger,
+    entry_point_group: str,
+    verbosity: typing.Callable[..., typing.Any],
+) -> click.Command:
+    """Build the ``describe`` subcommand of :py:func:`config_group`."""
+
+    @click.command(no_args_is_help=True, context_settings=_COMMON_CONTEXT_SETTINGS)
+    @click.pass_context
+    @click.argument(
+        "name",
+        required=True,
+        nargs=-1,
+    )
+    @verbosity
+    def describe(ctx, name, **_: typing.Any):
+        """Describe a specific configuration resource."""
+        import inspect
+        import pathlib
+
+        entry_points = _entry_points(entry_point_group)
+
+        for k in name:
+            if k not in entry_points:
+                logger.error(f"Cannot find configuration resource `{k}'")
+                continue
+            ep = entry_points[k]
+            click.echo(f"Configuration: {ep.name}")
+            click.echo(f"Python object: {ep.value}")
+            click.echo("")
+            mod = ep.load()
+
+            if ":" not in ep.value:
+                if (ctx.parent.params["verbose"] >= 1) or (ctx.params["verbose"] >= 1):
+                    fname = inspect.getfile(mod)
+                    click.echo("Contents:")
+                    # streams the file, so it is never fully loaded in memory
+                    with pathlib.Path(fname).open(encoding="utf-8") as f:
+                        for chunk in iter(lambda: f.read(65536), ""):
+                            click.echo(chunk, nl=False)
+                    click.echo("")
+                else:  # only output documentation, if module
+                    doc = inspect.getdoc(mod)
+                    if doc and doc.strip():
+                        click.echo("Documentation:")
+                        click.echo(doc)
+
+    return describe
+
+
+def _build_copy(
+    logger: logging.Logger,
+    entry_point_group: str,
+    verbosity: typing.Callable[..., typing.Any],
+) -> click.Command:
+    """Build the ``copy`` subcommand of :py:func:`config_group`."""
+
+    @click.command(no_args_is_help=True, context_settings=_COMMON_CONTEXT_SETTINGS)
+    @click.argument(
+        "source",
+        required=True,
+        nargs=1,
+    )
+    @click.argument(
+        "destination",
+        required=True,
+        nargs=1,
+    )
+    @verbosity
+    def copy(source, destination, **_: typing.Any):
+        """Copy a specific configuration resource so it can be modified
+        locally.
+        """
+        import importlib.util
+        import inspect
+        import shutil
+
+        entry_points = _entry_points(entry_point_group)
+
+        if source not in entry_points:
+            logger.error(f"Cannot find configuration resource `{source}'")
+            return 1
+        ep = entry_points[source]
+
+        # whole modules are located without being imported (executed)
+        spec = None
+        if ":" not in ep.value:
+            spec = importlib.util.find_spec(ep.value)
+        if spec is not None and spec.has_location:
+            src_name = spec.origin
+        else:
+            src_name = inspect.getfile(ep.load())
+        logger.info(f"cp {src_name} -> {destination}")
+        shutil.copyfile(src_name, destination)
+
+        return None
+
+    return copy
 
 
 def config_group(
@@ -679,184 +1038,36 @@ def config_group(
 
        $ user-cli config --help
        usage: ...
+
+    Subcommands are only built when they are first required (see
+    :py:class:`LazyGroup`).
     """
 
     def group_decorator(
         func: typing.Callable[..., typing.Any],
     ) -> typing.Callable[..., typing.Any]:
-        @click.group(cls=AliasedGroup, context_settings=_COMMON_CONTEXT_SETTINGS)
-        @verbosity_option(logger=logger)
-        @functools.wraps(func)
-        def group_wrapper(**kwargs):
-            return func(**kwargs)
+        # the same decorator is shared by the group and all its subcommands
+        verbosity = verbosity_option(logger=logger)
 
-        @group_wrapper.command(
-            name="list",
+        @click.group(
+            cls=LazyGroup,
+            lazy_subcommands={
+                "list": functools.partial(
+                    _build_list, logger, entry_point_group, verbosity
+                ),
+                "describe": functools.partial(
+                    _build_describe, logger, entry_point_group, verbosity
+                ),
+                "copy": functools.partial(
+                    _build_copy, logger, entry_point_group, verbosity
+                ),
+            },
             context_settings=_COMMON_CONTEXT_SETTINGS,
         )
-        @click.pass_context
-        @verbosity_option(logger=logger)
-        def list_(ctx, **_: typing.Any):
-            """List installed configuration resources."""
-            from importlib.metadata import entry_points  # type: ignore
-
-            entry_points: dict[str, EntryPoint] = {  # type: ignore
-                e.name: e for e in entry_points(group=entry_point_group)
-            }
-
-            # all modules with configuration resources
-            modules: set[str] = {
-                # note: k.module does not exist on Python < 3.9
-                k.value.split(":")[0].rsplit(".", 1)[0]
-                for k in entry_points.values()  # type: ignore
-            }
-            keep_modules: set[str] = set()
-            for k in sorted(modules):
-                if k not in keep_modules and not any(
-                    k.startswith(to_keep) for to_keep in keep_modules
-                ):
-                    keep_modules.add(k)
-            modules = keep_modules
-
-            # sort data entries by originating module
-            entry_points_by_module: dict[str, dict[str, EntryPoint]] = {}
-            for k in modules:
-                entry_points_by_module[k] = {}
-                for name, ep in entry_points.items():  # type: ignore
-                    # note: ep.module does not exist on Python < 3.9
-                    module = ep.value.split(":", 1)[0]  # works on Python 3.8
-                    if module.startswith(k):
-                        entry_points_by_module[k][name] = ep
-
-            for config_type in sorted(entry_points_by_module):
-                # calculates the longest config name so we offset the printing
-                longest_name_length = max(
-                    len(k) for k in entry_points_by_module[config_type].keys()
-                )
-
-                # set-up printing options
-                print_string = "    %%-%ds   %%s" % (longest_name_length,)
-                # 79 - 4 spaces = 75 (see string above)
-                description_leftover = 75 - longest_name_length
-
-                click.echo(f"module: {config_type}")
-                for name in sorted(entry_points_by_module[config_type]):
-                    ep = entry_points[name]  # type: ignore
-
-                    if (ctx.parent.params["verbose"] >= 1) or (
-                        ctx.params["verbose"] >= 1
-                    ):
-                        try:
-                            obj = ep.load()
-
-                            if ":" in ep.value:  # it's an object
-                                summary = (
-                                    f"[{type(obj).__name__}] {pprint.pformat(obj)}"
-                                )
-                                summary = summary.replace("\n", " ")
-                            else:  # it's a whole module
-                                summary = "[module] "
-                                doc = inspect.getdoc(obj)
-                                if doc is not None:
-                                    summary += doc.split("\n\n")[0]
-                                    summary = summary.replace("\n", " ")
-                                else:
-                                    summary += "[undocumented]"
-
-                        except Exception as ex:
-                            summary = "(cannot be loaded; add another -v for details)"
-                            if (ctx.parent.params["verbose"] >= 2) or (
-                                ctx.params["verbose"] >= 2
-                            ):
-                                logger.exception(ex)
-
-                    else:
-                        summary = ""
-
-                    summary = (
-                        (summary[: (description_leftover - 3)] + "...")
-                        if len(summary) > (description_leftover - 3)
-                        else summary
-                    )
-
-                    click.echo(print_string % (name, summary))
-
-        @group_wrapper.command(
-            no_args_is_help=True, context_settings=_COMMON_CONTEXT_SETTINGS
-        )
-        @click.pass_context
-        @click.argument(
-            "name",
-            required=True,
-            nargs=-1,
-        )
-        @verbosity_option(logger=logger)
-        def describe(ctx, name, **_: typing.Any):
-            """Describe a specific configuration resource."""
-            from importlib.metadata import entry_points  # type: ignore
-
-            entry_points: dict[str, EntryPoint] = {  # type: ignore
-                e.name: e for e in entry_points(group=entry_point_group)
-            }
-
-            for k in name:
-                if k not in entry_points:  # type: ignore
-                    logger.error(f"Cannot find configuration resource `{k}'")
-                    continue
-                ep = entry_points[k]  # type: ignore
-                click.echo(f"Configuration: {ep.name}")
-                click.echo(f"Python object: {ep.value}")
-                click.echo("")
-                mod = ep.load()
-
-                if ":" not in ep.value:
-                    if (ctx.parent.params["verbose"] >= 1) or (
-                        ctx.params["verbose"] >= 1
-                    ):
-                        fname = inspect.getfile(mod)
-                        click.echo("Contents:")
-                        with pathlib.Path(fname).open() as f:
-                            click.echo(f.read())
-                    else:  # only output documentation, if module
-                        doc = inspect.getdoc(mod)
-                        if doc and doc.strip():
-                            click.echo("Documentation:")
-                            click.echo(doc)
-
-        @group_wrapper.command(
-            no_args_is_help=True, context_settings=_COMMON_CONTEXT_SETTINGS
-        )
-        @click.argument(
-            "source",
-            required=True,
-            nargs=1,
-        )
-        @click.argument(
-            "destination",
-            required=True,
-            nargs=1,
-        )
-        @verbosity_option(logger=logger)
-        def copy(source, destination, **_: typing.Any):
-            """Copy a specific configuration resource so it can be modified
-            locally.
-            """
-            from importlib.metadata import entry_points  # type: ignore
-
-            entry_points: dict[str, EntryPoint] = {  # type: ignore
-                e.name: e for e in entry_points(group=entry_point_group)
-            }
-
-            if source not in entry_points:  # type: ignore
-                logger.error(f"Cannot find configuration resource `{source}'")
-                return 1
-            ep = entry_points[source]  # type: ignore
-            mod = ep.load()
-            src_name = inspect.getfile(mod)
-            logger.info(f"cp {src_name} -> {destination}")
-            shutil.copyfile(src_name, destination)
-
-            return None
+        @verbosity
+        @functools.wraps(func)
+        def group_wrapper(**kwargs):
+            return func(**kwargs)
 
         return group_wrapper
 
@@ -873,11 +1084,19 @@ def log_parameters(logger_handle: logging.Logger, ignore: tuple[str] | None = No
     ignore
         List of the parameters to ignore when logging. (Tuple)
     """
-    ignore = ignore or tuple()
+    # nothing would be emitted: skip going through all parameters
+    if not logger_handle.isEnabledFor(logging.DEBUG):
+        return
+
+    # a single name may be passed as a plain string, e.g. ``ignore=("name")``
+    if isinstance(ignore, str):
+        ignore = (ignore,)
+    ignored = frozenset(ignore or ())
     ctx = click.get_current_context()
+    debug = logger_handle.debug
     # do not sort the ctx.params dict. The insertion order is kept in Python 3
     # and is useful (but not necessary so works on Python 2 too).
     for k, v in ctx.params.items():
-        if k in ignore:
+        if k in ignored:
             continue
-        logger_handle.debug("%s: %s", k, v)
+        debug("%s: %s", k, v)
@@ -5,13 +5,15 @@
 
 """Functionality to implement python-based config file parsing and loading."""
 
+import functools
 import importlib.util
 import logging
+import os
 import pathlib
 import types
 import typing
 
-from importlib.metadata import EntryPoint, entry_points
+from importlib.metadata import EntryPoint, EntryPoints, entry_points
 
 logger = logging.getLogger(__name__)
 
@@ -50,12 +52,39 @@ def _load_context(path: str, mod: types.ModuleType) -> types.ModuleType:
         A python module with the fully resolved context
     """
     # executes the module code on the context of previously imported modules
-    with pathlib.Path(path).open("rb") as f:
-        exec(compile(f.read(), path, "exec"), mod.__dict__)
+    stat = pathlib.Path(path).stat()
+    exec(_compile(path, stat.st_mtime_ns, stat.st_size), mod.__dict__)
 
     return mod
 
 
+@functools.lru_cache(maxsize=128)
+def _compile(path: str, mtime_ns: int, size: int) -> types.CodeType:
+    """Compile a Python file, reusing code objects of unchanged files.
+
+    The file modification time and size are part of the cache key, so that
+    files edited since they were last compiled are compiled again.
+    """
+    # whole-file read: unbuffered to skip the intermediate buffer
+    with pathlib.Path(path).open("rb", buffering=0) as f:
+        return compile(f.read(), path, "exec")
+
+
+@functools.cache
+def _group_entry_points(group: str) -> EntryPoints:
+    """Return the entry-points of a group, scanning distributions only once.
+
+    Call :py:func:`_reset_entry_point_cache` if distributions are installed or
+    removed after the first call.
+    """
+    return entry_points(group=group)
+
+
+def _reset_entry_point_cache() -> None:
+    """Clear the cache of :py:func:`_group_entry_points`."""
+    _group_entry_points.cache_clear()
+
+
 def _get_module_filename(module_name: str) -> str | None:
     """Resolve a module name to an actual Python file.
 
@@ -78,7 +107,7 @@ def _get_module_filename(module_name: str) -> str | None:
         if module_spec is None:
             return None
         return module_spec.origin
-    except (ModuleNotFoundError,):
+    except ModuleNotFoundError:
         return None
 
 
@@ -136,9 +165,10 @@ def _resolve_entry_point_or_modules(
         If one of the paths cannot be resolved to an actual path to a file.
     """
 
-    if entry_point_group is not None:
+    # only scan entry-points if there is anything to resolve
+    if entry_point_group is not None and paths:
         entry_point_dict: dict[str, EntryPoint] = {
-            e.name: e for e in entry_points(group=entry_point_group)
+            e.name: e for e in _group_entry_points(entry_point_group)
         }
     else:
         entry_point_dict = {}
@@ -146,13 +176,14 @@ def _resolve_entry_point_or_modules(
     files = []
     module_names = []
     object_names = []
+    isfile = os.path.isfile
 
     for path in paths:
         module_name = "user_config"  # fixed module name for files with full paths
         resolved_path, object_name = _object_name(path, common_name)
 
         # if it already points to a file, then do nothing
-        if pathlib.Path(resolved_path).is_file():
+        if isfile(resolved_path):
             pass
 
         # If it is an entry point name, collect path and module name
@@ -162,7 +193,7 @@ def _resolve_entry_point_or_modules(
             object_name = entry.attr if entry.attr else common_name
 
             resolved_path = _get_module_filename(module_name)
-            if resolved_path is None or not pathlib.Path(resolved_path).is_file():
+            if resolved_path is None or not isfile(resolved_path):
                 raise ValueError(
                     f"The specified entry point `{path}' pointing to module "
                     f"`{module_name}' and resolved to `{resolved_path}' does "
@@ -173,7 +204,7 @@ def _resolve_entry_point_or_modules(
         else:
             # if we have gotten here so far then path must resolve as a module
             resolved_path = _get_module_filename(resolved_path)
-            if resolved_path is None or not pathlib.Path(resolved_path).is_file():
+            if resolved_path is None or not isfile(resolved_path):
                 raise ValueError(
                     f"The specified path `{path}' is not a file, a entry "
                     f"point name, or a known-module name"
@@ -256,12 +287,12 @@ def load(
     for k, n in zip(resolved_paths, names):
         logger.debug("Loading configuration file `%s'...", k)
         mod = types.ModuleType(n)
-        # remove the keys that might break the loading of the next config file.
-        ctxt.__dict__.pop("__name__", None)
-        ctxt.__dict__.pop("__package__", None)
-        # do not propogate __ variables
-        context = {k: v for k, v in ctxt.__dict__.items() if not k.startswith("__")}
-        mod.__dict__.update(context)
+        # do not propogate __ variables (such as __name__ or __package__, which
+        # might break the loading of the next config file)
+        mod_dict = mod.__dict__
+        for key, value in ctxt.__dict__.items():
+            if not key.startswith("__"):
+                mod_dict[key] = value
         _LOADED_CONFIGS.append(mod)
         ctxt = _load_context(k, mod)
 
@@ -271,13 +302,15 @@ def load(
     # We pick the last object_name here. Normally users should provide just one
     # path when enabling the attribute_name parameter.
     attribute_name = object_names[-1]
-    if attribute_name is not None and not hasattr(mod, attribute_name):
+    # config variables live in the module namespace: look them up directly
+    variables = mod.__dict__
+    if attribute_name is not None and attribute_name not in variables:
         raise ImportError(
             f"The desired variable `{attribute_name}' does not exist in any of "
             f"your configuration files: {', '.join(resolved_paths)}"
         )
 
-    return getattr(mod, attribute_name)
+    return variables[attribute_name]
 
 
 def mod_to_context(mod: types.ModuleType) -> dict[str, typing.Any]:
@@ -333,13 +366,11 @@ def resource_keys(
         Alphabetically sorted list of resources matching your query
     """
 
-    ret_list = [
-        k.name
-        for k in entry_points(group=entry_point_group)
-        if (
-            (not k.name.strip().startswith(exclude_packages))
-            and (not k.name.startswith(strip))
-        )
-    ]
-    ret_list = list(dict.fromkeys(ret_list))  # order-preserving uniq
-    return sorted(ret_list)
+    # uniq and sorted
+    return sorted(
+        {
+            k.name
+            for k in _group_entry_points(entry_point_group)
+            if not k.name.startswith(exclude_packages) and not k.name.startswith(strip)
+        }
+    )
@@ -11,16 +11,11 @@ import typing
 
 
 # debug and info messages are written to sys.stdout
-class _InfoFilter(logging.Filter):
-    """Filter-class to delete any log-record with level above
-    :any:`logging.INFO` **before** reaching the handler.
+def _info_filter(record: logging.LogRecord) -> bool:
+    """Filter to delete any log-record with level above :any:`logging.INFO`
+    **before** reaching the handler.
     """
-
-    def __init__(self):
-        super().__init__()
-
-    def filter(self, record):
-        return record.levelno <= logging.INFO
+    return record.levelno <= logging.INFO
 
 
 def setup(
@@ -74,31 +69,35 @@ def setup(
 
     logger = logging.getLogger(logger_name)
 
+    # streams of installed handlers, by handler name
+    streams_installed = {k.name: getattr(k, "stream", None) for k in logger.handlers}
+    debug_logger_name = f"debug_info+{logger_name}"
+    error_logger_name = f"warn_err+{logger_name}"
+
+    # nothing to do if both handlers are already installed (e.g. on repeated
+    # calls)
+    if (
+        streams_installed.get(debug_logger_name) is low_level_stream
+        and streams_installed.get(error_logger_name) is high_level_stream
+    ):
+        return logger
+
     if formatter is None:
         formatter = logging.Formatter(format)
 
-    handlers_installed = {k.name: k for k in logger.handlers}
-    debug_logger_name = f"debug_info+{logger_name}"
-
     # First check that logger with a matching name or stream is not already
     # there before attaching a new one.
-    if (debug_logger_name not in handlers_installed) or (
-        getattr(handlers_installed[debug_logger_name], "stream") != low_level_stream
-    ):
+    if streams_installed.get(debug_logger_name) is not low_level_stream:
         debug_info = logging.StreamHandler(low_level_stream)
         debug_info.setLevel(logging.DEBUG)
         debug_info.setFormatter(formatter)
-        debug_info.addFilter(_InfoFilter())
+        debug_info.addFilter(_info_filter)
         debug_info.name = debug_logger_name
         logger.addHandler(debug_info)
 
-    error_logger_name = f"warn_err+{logger_name}"
-
     # First check that logger with a matching name or stream is not already
     # there before attaching a new one.
-    if (error_logger_name not in handlers_installed) or (
-        getattr(handlers_installed[error_logger_name], "stream") != high_level_stream
-    ):
+    if streams_installed.get(error_logger_name) is not high_level_stream:
         warn_err = logging.StreamHandler(high_level_stream)
         warn_err.setLevel(logging.WARNING)
         warn_err.setFormatter(formatter)
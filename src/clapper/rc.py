@@ -6,15 +6,23 @@
 """Implements a global configuration system setup and readout."""
 
 import collections.abc
+import copy
 import io
-import json
 import logging
+import os
 import pathlib
+import shutil
+import tempfile
 import typing
 
-import tomli
-import tomli_w
-import xdg
+# note: json, tomli, tomli_w and xdg are only imported when files are read or
+# written, so importing this module (e.g. to declare a CLI) stays cheap
+
+
+_PARSED_FILES: dict[pathlib.Path, tuple[tuple[int, int], dict[str, typing.Any]]] = {}
+"""Contents of user defaults files read with caching enabled, indexed by path,
+along with the modification time (ns) and size of the file they were parsed
+from."""
 
 
 class UserDefaults(collections.abc.MutableMapping):
@@ -45,6 +53,10 @@ class UserDefaults(collections.abc.MutableMapping):
     logger
         A logger to use for messaging operations.  If not set, use this
         module's logger.
+    cache
+        If set, parsed file contents are kept in memory, and reused as long as
+        the file modification time and size do not change, when this file is
+        read again (by this or any other object with caching enabled).
 
     Attributes
     ----------
@@ -56,15 +68,19 @@ class UserDefaults(collections.abc.MutableMapping):
         self,
         path: str | pathlib.Path,
         logger: logging.Logger | None = None,
+        cache: bool = False,
     ) -> None:
         self.logger = logger or logging.getLogger(__name__)
+        self.cache = cache
 
         self.path = pathlib.Path(path).expanduser()
 
         if not self.path.is_absolute():
+            import xdg
+
             self.path = xdg.xdg_config_home() / self.path
 
-        self.logger.info(f"User configuration file set to `{str(self.path)}'")
+        self.logger.info("User configuration file set to `%s'", self.path)
         self.data: dict[str, typing.Any] = {}
         self.read()
 
@@ -74,71 +90,126 @@ class UserDefaults(collections.abc.MutableMapping):
             self.logger.debug("User configuration file exists, reading contents...")
             self.data.clear()
 
-            with self.path.open("rb") as f:
+            if self.cache:
+                stat = self.path.stat()
+                key = (stat.st_mtime_ns, stat.st_size)
+                cached = _PARSED_FILES.get(self.path)
+                if cached is not None and cached[0] == key:
+                    self.logger.debug("Reusing previously parsed contents")
+                    self.data.update(copy.deepcopy(cached[1]))
+                    return
+
+            with self.path.open("rb", buffering=0) as f:
                 contents = f.read()
 
             # Support for legacy JSON file format.  Remove after sometime
             # FYI: today is September 16, 2022
-            try:
-                data = json.loads(contents)
-                self.logger.warning(
-                    f"Converting `{str(self.path)}' from (legacy) JSON "
-                    f"to (new) TOML format"
-                )
-                self.update(data)
-                self.write()
-                self.clear()
-                # reload contents
-                with self.path.open("rb") as f:
-                    contents = f.read()
-            except ValueError:
-                pass
-
-            self.data.update(tomli.load(io.BytesIO(contents)))
+            # JSON contents were objects, and a TOML document cannot start with
+            # "{": only try to decode JSON in this case
+            if contents.lstrip()[:1] == b"{":
+                import json
+
+                try:
+                    data = json.loads(contents)
+                    self.logger.warning(
+                        "Converting `%s' from (legacy) JSON to (new) TOML format",
+                        self.path,
+                    )
+                    self.update(data)
+                    self.write()
+                    self.clear()
+                    # reload contents
+                    if self.cache:
+                        stat = self.path.stat()
+                        key = (stat.st_mtime_ns, stat.st_size)
+                    with self.path.open("rb", buffering=0) as f:
+                        contents = f.read()
+                except ValueError:
+                    pass
+
+            import tomli
+
+            data = tomli.loads(contents.decode("utf-8"))
+            if self.cache:
+                _PARSED_FILES[self.path] = (key, data)
+                data = copy.deepcopy(data)
+            self.data.update(data)
 
         else:
             self.logger.debug("Initializing empty user configuration...")
 
     def write(self) -> None:
         """Store any modifications done on the user configuration."""
-        if self.path.exists():
-            backup = pathlib.Path(str(self.path) + "~")
-            self.logger.debug(f"Backing-up {str(self.path)} -> {str(backup)}")
-            self.path.rename(backup)
-
-        with self.path.open("wb") as f:
-            tomli_w.dump(self.data, f)
-
-        self.logger.info(f"Wrote configuration at {str(self.path)}")
+        import tomli_w
+
+        _PARSED_FILES.pop(self.path, None)
+
+        # contents are written to a new file aside first, which then replaces
+        # the configuration file: it is never missing nor half-written
+        path_str = str(self.path)
+        f = tempfile.NamedTemporaryFile(
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            suffix=".tmp",
+            delete=False,
+        )
+        tmp = pathlib.Path(f.name)
+        try:
+            with f:
+                tomli_w.dump(self.data, f)
+
+            if self.path.exists():
+                shutil.copymode(self.path, tmp)
+                backup = pathlib.Path(path_str + "~")
+                backup.unlink(missing_ok=True)
+                try:
+                    # a hard-link keeps the original in place for the replace
+                    os.link(self.path, backup)
+                except OSError:
+                    shutil.copy2(self.path, backup)
+                self.logger.debug("Backed-up %s -> %s", path_str, backup)
+            else:
+                # temporary files are private: use the default file mode
+                umask = os.umask(0)
+                os.umask(umask)
+                tmp.chmod(0o666 & ~umask)
+
+            tmp.replace(self.path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+        self.logger.info("Wrote configuration at %s", path_str)
 
     def __str__(self) -> str:
+        import tomli_w
+
         t = io.BytesIO()
         tomli_w.dump(self.data, t)
         return t.getvalue().decode(encoding="utf-8")
 
     def __getitem__(self, k: str) -> typing.Any:
-        if k in self.data:
-            return self.data[k]
+        data = self.data
+        if k in data:
+            return data[k]
 
         if "." in k:
             # search for a key with a matching name after the "."
-            parts = k.split(".")
-            base = self.data
-            for n in range(len(parts)):
-                if parts[n] in base:
-                    base = base[parts[n]]
-                    if (not isinstance(base, dict)) and (n < (len(parts) - 1)):
-                        # this is an actual value, not another dict whereas it
-                        # should not as we have more parts to go
-                        break
-                else:
+            base = data
+            pos = 0
+            for part in k.split(".")[:-1]:
+                base = base.get(part)
+                if not isinstance(base, dict):
+                    # missing, or an actual value, not another dict whereas it
+                    # should not as we have more parts to go
                     break
-                subkey = ".".join(parts[(n + 1) :])
+                pos += len(part) + 1
+                subkey = k[pos:]
                 if subkey in base:
                     return base[subkey]
 
         # otherwise, defaults to the default behaviour
-        return self.data.__getitem__(k)
+        return data[k]
 
     def __setitem__(self, k: str, v: typing.Any) -> None:
         assert isinstance(k, str)
@@ -159,34 +230,33 @@ class UserDefaults(collections.abc.MutableMapping):
             return v
 
         # otherwise, defaults to the default behaviour
-        return self.data.__setitem__(k, v)
+        self.data[k] = v
+        return None
 
     def __delitem__(self, k: str) -> None:
         assert isinstance(k, str)
 
         if "." in k:
             # search for a key with a matching name after the "."
-            parts = k.split(".")
             base = self.data
-            for n in range(len(parts) - 1):
-                if parts[n] in base:
-                    base = base[parts[n]]
-                    if not isinstance(base, dict):
-                        # this is an actual value, not another dict whereas it
-                        # should not as we have more parts to go
-                        break
-                else:
+            pos = 0
+            for part in k.split(".")[:-1]:
+                base = base.get(part)
+                if not isinstance(base, dict):
+                    # missing, or an actual value, not another dict whereas it
+                    # should not as we have more parts to go
                     break
-                subkey = ".".join(parts[(n + 1) :])
+                pos += len(part) + 1
+                subkey = k[pos:]
                 if subkey in base:
                     del base[subkey]
-                    return None
+                    return
 
         # otherwise, defaults to the default behaviour
-        return self.data.__delitem__(k)
+        del self.data[k]
 
     def __iter__(self) -> typing.Iterator[str]:
-        return self.data.__iter__()
+        return iter(self.data)
 
     def __len__(self) -> int:
-        return self.data.__len__()
+        return len(self.data)
@@ -58,16 +58,16 @@ class MyCliRunner(CliRunner):
 
         return super().invoke(cli, args=args, **params)
 
-    def isolation(self, input_=None, env=None, color=False):
+    def isolation(self, input=None, env=None, color=False):  # noqa: A002
         if self._in_pdb:
-            if input_ or env or color:
+            if input or env or color:
                 warnings.warn(
                     "CliRunner PDB un-isolation doesn't work if input/env/color are passed"
                 )
             else:
                 return self.isolation_pdb()
 
-        return super().isolation(input=input_, env=env, color=color)
+        return super().isolation(input=input, env=env, color=color)
 
     @contextlib.contextmanager
     def isolation_pdb(self):
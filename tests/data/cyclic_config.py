@@ -0,0 +1,3 @@
+"""Configuration module that resolves to itself."""
+
+a = "tests.data.cyclic_config"
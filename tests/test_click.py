@@ -3,22 +3,27 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-import difflib
+import functools
+import itertools
 import logging
 
 import click
+import pytest
 
 from clapper.click import (
     AliasedGroup,
     ConfigCommand,
+    LazyGroup,
     ResourceOption,
     log_parameters,
     verbosity_option,
 )
 from click.testing import CliRunner
 
+logger = logging.getLogger(__name__)
 
-def test_prefix_aliasing():
+
+def test_prefix_aliasing(cli_runner):
     @click.group(cls=AliasedGroup)
     def cli():
         pass
@@ -31,116 +36,184 @@ def test_prefix_aliasing():
     def test_aaa():
         click.echo("AAA")
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["te"], catch_exceptions=False)
+    result = cli_runner.invoke(cli, ["te"], catch_exceptions=False)
     assert result.exit_code != 0
 
-    result = runner.invoke(cli, ["test"], catch_exceptions=False)
+    result = cli_runner.invoke(cli, ["test"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "OK" in result.output, (result.exit_code, result.output)
 
-    result = runner.invoke(cli, ["test-a"], catch_exceptions=False)
+    result = cli_runner.invoke(cli, ["test-a"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "AAA" in result.output, (result.exit_code, result.output)
 
-    result = runner.invoke(cli, ["test-aaaa"], catch_exceptions=False)
+    result = cli_runner.invoke(cli, ["test-aaaa"], catch_exceptions=False)
     assert result.exit_code != 0
 
+    # commands added after the first lookups are also found
+    @cli.command()
+    def other():
+        click.echo("OTHER")
 
-def test_commands_with_config_1():
-    # random test
-    @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
-    def cli(**_):
-        pass
+    result = cli_runner.invoke(cli, ["ot"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert "OTHER" in result.output, (result.exit_code, result.output)
 
-    runner = CliRunner()
-    result = runner.invoke(cli, ["first"])
+    # commands assigned directly to the group are also found
+    @click.command()
+    def pull():
+        click.echo("PULL")
+
+    cli.commands["pull"] = pull
+    result = cli_runner.invoke(cli, ["pul"], catch_exceptions=False)
     assert result.exit_code == 0
+    assert "PULL" in result.output, (result.exit_code, result.output)
 
 
-def test_commands_with_config_2():
-    # test option with valid default value
-    @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
-    @click.option("-a", type=click.INT, cls=ResourceOption)
-    def cli(a, **_):
-        assert isinstance(a, int), (type(a), a)
-        click.echo(f"{a}")
+def test_prefix_aliasing_custom_order(cli_runner):
+    class ReversedGroup(AliasedGroup):
+        def list_commands(self, ctx):
+            return sorted(self.commands, reverse=True)
 
-    runner = CliRunner()
+    @click.group(cls=ReversedGroup)
+    def cli():
+        pass
 
-    result = runner.invoke(cli, ["first"])
-    assert result.exit_code == 0
-    assert result.output.strip() == "1"
+    @cli.command()
+    def alpha():
+        click.echo("ALPHA")
 
-    result = runner.invoke(cli, ["-a", "2"])
-    assert result.exit_code == 0
-    assert result.output.strip() == "2"
+    @cli.command()
+    def zeta():
+        click.echo("ZETA")
 
-    result = runner.invoke(cli, ["-a", "3", "first"])
+    result = cli_runner.invoke(cli, ["al"], catch_exceptions=False)
     assert result.exit_code == 0
-    assert result.output.strip() == "3"
+    assert "ALPHA" in result.output, (result.exit_code, result.output)
 
-    result = runner.invoke(cli, ["first", "-a", "3"])
-    assert result.exit_code == 0
-    assert result.output.strip() == "3"
 
+def test_lazy_group(cli_runner):
+    built = []
 
-def test_commands_with_config_3():
-    # test required options
-    @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
-    @click.option("-a", cls=ResourceOption, required=True)
-    def cli(a, **_):
-        click.echo(f"{a}")
+    def _build(name):
+        built.append(name)
 
-    runner = CliRunner()
+        @click.command(name=name)
+        def cmd():
+            click.echo(name.upper())
 
-    result = runner.invoke(cli, [])
-    assert result.exit_code == 2
+        return cmd
 
-    result = runner.invoke(cli, ["first"])
-    assert result.exit_code == 0
-    assert result.output.strip() == "1"
+    @click.group(
+        cls=LazyGroup,
+        lazy_subcommands={
+            "test": functools.partial(_build, "test"),
+            "test-aaa": functools.partial(_build, "test-aaa"),
+            "other": functools.partial(_build, "other"),
+        },
+    )
+    def cli():
+        pass
 
-    result = runner.invoke(cli, ["-a", "2"])
+    result = cli_runner.invoke(cli, ["test"], catch_exceptions=False)
     assert result.exit_code == 0
-    assert result.output.strip() == "2"
+    assert "TEST" in result.output, (result.exit_code, result.output)
+    assert built == ["test"]
 
-    result = runner.invoke(cli, ["-a", "3", "first"])
+    result = cli_runner.invoke(cli, ["test-a"], catch_exceptions=False)
     assert result.exit_code == 0
-    assert result.output.strip() == "3"
+    assert "TEST-AAA" in result.output, (result.exit_code, result.output)
+    assert built == ["test", "test-aaa"]
 
-    result = runner.invoke(cli, ["first", "-a", "3"])
+    result = cli_runner.invoke(cli, ["te"], catch_exceptions=False)
+    assert result.exit_code != 0
+    assert built == ["test", "test-aaa"]
+
+    result = cli_runner.invoke(cli, ["--help"], catch_exceptions=False)
     assert result.exit_code == 0
-    assert result.output.strip() == "3"
+    assert "other" in result.output
+    assert built == ["test", "test-aaa", "other"]
+
+
+@pytest.mark.parametrize(
+    "option_kwargs,invocations",
+    [
+        # random test
+        (None, [(["first"], 0, None)]),
+        # test option with valid default value
+        (
+            dict(type=click.INT),
+            [
+                (["first"], 0, "1"),
+                (["-a", "2"], 0, "2"),
+                (["-a", "3", "first"], 0, "3"),
+                (["first", "-a", "3"], 0, "3"),
+            ],
+        ),
+        # test required options
+        (
+            dict(required=True),
+            [
+                ([], 2, None),
+                (["first"], 0, "1"),
+                (["-a", "2"], 0, "2"),
+                (["-a", "3", "first"], 0, "3"),
+                (["first", "-a", "3"], 0, "3"),
+            ],
+        ),
+    ],
+    ids=["no-option", "default", "required"],
+)
+def test_commands_with_config(cli_runner, option_kwargs, invocations):
+    @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
+    def cli(a=None, **_):
+        if option_kwargs is None:
+            return
+        if option_kwargs.get("type") is click.INT:
+            assert isinstance(a, int), (type(a), a)
+        click.echo(f"{a}")
+
+    if option_kwargs is not None:
+        cli = click.option("-a", cls=ResourceOption, **option_kwargs)(cli)
+
+    for args, exit_code, output in invocations:
+        result = cli_runner.invoke(cli, args)
+        assert result.exit_code == exit_code, (args, result.output)
+        if output is not None:
+            assert result.output.strip() == output
 
 
 def _assert_config_dump(output, ref, ref_date):
-    with output.open("rt") as f, ref.open() as f2:
-        diff = difflib.ndiff(f.readlines(), f2.readlines())
-        important_diffs = [k for k in diff if k.startswith(("+", "-"))]
-
-        # check and remove differences on the generation date
-        if (
-            len(important_diffs) >= 2
-            and important_diffs[0].startswith(
-                '- """Configuration file automatically generated at '
-            )
-            and important_diffs[1].startswith(
-                '+ """Configuration file automatically generated at '
-            )
-        ):
-            important_diffs = important_diffs[2:]
-
-        important_diffs = "".join(important_diffs)
-
-        assert len(important_diffs) == 0, (
+    # compare raw bytes: contents are only decoded to report differences
+    output_lines = output.read_bytes().splitlines(keepends=True)
+    ref_lines = ref.read_bytes().splitlines(keepends=True)
+
+    # ignore differences on the generation date
+    date_line = b'"""Configuration file automatically generated at '
+    if all(k[:1] and k[0].startswith(date_line) for k in (output_lines, ref_lines)):
+        output_lines = output_lines[1:]
+        ref_lines = ref_lines[1:]
+
+    # only compute a diff to report differences
+    if output_lines != ref_lines:
+        import difflib
+
+        diff = difflib.unified_diff(
+            [k.decode() for k in output_lines],
+            [k.decode() for k in ref_lines],
+            str(output),
+            str(ref),
+            n=1,
+        )
+        important_diffs = "".join(itertools.islice(diff, 200))
+        raise AssertionError(
             f"Differences between "
             f"{str(output)} and {str(ref)} files observed: "
             f"{important_diffs}"
         )
 
 
-def test_config_dump(tmp_path, datadir):
+def test_config_dump(cli_runner, tmp_path, datadir):
     @click.command(cls=ConfigCommand, epilog="Examples!")
     @click.option(
         "-t",
@@ -150,14 +223,13 @@ def test_config_dump(tmp_path, datadir):
         help="Path leading to test blablabla",
         cls=ResourceOption,
     )
-    @verbosity_option(logging.getLogger(__name__), cls=ResourceOption)
+    @verbosity_option(logger, cls=ResourceOption)
     def test(**_):
         """Test command."""
         pass
 
-    runner = CliRunner()
     output = tmp_path / "test_dump.py"
-    result = runner.invoke(
+    result = cli_runner.invoke(
         test,
         ["-H", str(output)],
         catch_exceptions=False,
@@ -167,7 +239,7 @@ def test_config_dump(tmp_path, datadir):
     _assert_config_dump(output, ref, "10/09/2022")
 
 
-def test_config_dump2(tmp_path, datadir):
+def test_config_dump2(cli_runner, tmp_path, datadir):
     @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
     @click.option(
         "--database",
@@ -208,7 +280,7 @@ def test_config_dump2(tmp_path, datadir):
         default="~/databases.txt",
         help="lklklklk",
     )
-    @verbosity_option(logging.getLogger(__name__), cls=ResourceOption)
+    @verbosity_option(logger, cls=ResourceOption)
     def test(**_):
         """Blablabla bli blo.
 
@@ -223,9 +295,10 @@ def test_config_dump2(tmp_path, datadir):
         """
         pass
 
-    runner = CliRunner()
     output = tmp_path / "test_dump.py"
-    result = runner.invoke(test, ["test", "-H", str(output)], catch_exceptions=False)
+    result = cli_runner.invoke(
+        test, ["test", "-H", str(output)], catch_exceptions=False
+    )
 
     ref = datadir / "test_dump_config2.py"
     assert result.exit_code == 0
@@ -234,7 +307,7 @@ def test_config_dump2(tmp_path, datadir):
 
 def test_config_command_with_callback_options():
     @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
-    @verbosity_option(logging.getLogger(__name__), envvar="VERBOSE", cls=ResourceOption)
+    @verbosity_option(logger, envvar="VERBOSE", cls=ResourceOption)
     @click.pass_context
     def cli(ctx, **_):
         verbose = ctx.meta["verbose"]
@@ -253,7 +326,7 @@ def test_config_command_with_callback_options():
     assert result.exit_code == 0
 
 
-def test_resource_option():
+def test_resource_option(cli_runner):
     # test usage without ConfigCommand and with entry_point_group
     @click.command()
     @click.option(
@@ -262,8 +335,7 @@ def test_resource_option():
     def cli1(a):
         assert a == 1
 
-    runner = CliRunner()
-    result = runner.invoke(cli1, ["-a", "tests.data.basic_config"])
+    result = cli_runner.invoke(cli1, ["-a", "tests.data.basic_config"])
     assert result.exit_code == 0
 
     # test usage without ConfigCommand and without entry_point_group
@@ -273,8 +345,7 @@ def test_resource_option():
     def cli2(**_):
         raise ValueError("Should not have reached here!")
 
-    runner = CliRunner()
-    result = runner.invoke(cli2, ["-a", "1"], catch_exceptions=True)
+    result = cli_runner.invoke(cli2, ["-a", "1"], catch_exceptions=True)
     assert result.exit_code != 0
     assert isinstance(result.exception, TypeError)
     assert str(result.exception).startswith("The ResourceOption class is not")
@@ -291,17 +362,31 @@ def test_resource_option():
     def cli3(a):
         assert a == "tests.data.basic_config"
 
-    runner = CliRunner()
-    result = runner.invoke(cli3, ["-a", "tests.data.basic_config"])
+    result = cli_runner.invoke(cli3, ["-a", "tests.data.basic_config"])
     assert result.exit_code == 0
 
+    # test ResourceOption values that resolve back to themselves
+    @click.command()
+    @click.option(
+        "-a", "--a", cls=ResourceOption, entry_point_group="clapper.test.config"
+    )
+    def cli4(**_):
+        raise ValueError("Should not have reached here!")
 
-def test_log_parameter():
+    result = cli_runner.invoke(cli4, ["-a", "tests.data.cyclic_config"])
+    assert result.exit_code == 2
+    assert "refers back to itself" in result.output
+
+
+def test_log_parameter(cli_runner):
     # Fake logger that checks if log_parameters accesses it
     class DummyLogger:
         def __init__(self):
             self.accessed = False
 
+        def isEnabledFor(self, level):  # noqa: N802
+            return True
+
         def debug(self, s, k, v):
             self.accessed = True
 
@@ -315,14 +400,16 @@ def test_log_parameter():
         log_parameters(dummy_logger)
         assert dummy_logger.accessed
 
-    runner = CliRunner()
-    result = runner.invoke(cli_log, ["-a", "aparam"])
+    result = cli_runner.invoke(cli_log, ["-a", "aparam"])
     assert result.exit_code == 0
 
 
-def test_log_parameter_with_ignore():
+def test_log_parameter_with_ignore(cli_runner):
     # Fake logger that ensures that the parameter 'a' is ignored
     class DummyLogger:
+        def isEnabledFor(self, level):  # noqa: N802
+            return True
+
         def debug(self, s, k, v):
             assert "a" not in k
 
@@ -335,6 +422,52 @@ def test_log_parameter_with_ignore():
     def cli_log(a, b):
         log_parameters(DummyLogger(), ignore=("a"))
 
-    runner = CliRunner()
-    result = runner.invoke(cli_log, ["-a", "aparam", "-b", "bparam"])
+    result = cli_runner.invoke(cli_log, ["-a", "aparam", "-b", "bparam"])
+    assert result.exit_code == 0
+
+
+def test_log_parameter_debug_disabled(cli_runner):
+    # Fake logger that checks log_parameters does not log if debug is disabled
+    class DummyLogger:
+        def isEnabledFor(self, level):  # noqa: N802
+            return level > logging.DEBUG
+
+        def debug(self, s, k, v):
+            raise AssertionError("Should not have logged!")
+
+    @click.command()
+    @click.option("-a", "--a")
+    def cli_log(a):
+        log_parameters(DummyLogger())
+
+    result = cli_runner.invoke(cli_log, ["-a", "aparam"])
     assert result.exit_code == 0
+
+
+def test_config_command_help_skips_configs(cli_runner):
+    # configs are not loaded if help is requested
+    @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
+    @click.option("-a", cls=ResourceOption)
+    def cli(**_):
+        raise ValueError("Should not have reached here!")
+
+    result = cli_runner.invoke(cli, ["error-config", "--help"])
+    assert result.exit_code == 0, (result.exit_code, result.output)
+    assert "Usage:" in result.output
+
+    result = cli_runner.invoke(cli, ["error-config"])
+    assert result.exit_code != 0
+    assert isinstance(result.exception, ValueError)
+
+
+def test_config_command_help_as_option_value(cli_runner):
+    # a help option name given as an option value is not a help request
+    @click.command(cls=ConfigCommand, entry_point_group="clapper.test.config")
+    @click.option("-a", cls=ResourceOption)
+    @click.option("--name", cls=ResourceOption)
+    def cli(a, name, **_):
+        click.echo(f"a={a} name={name}")
+
+    result = cli_runner.invoke(cli, ["first", "--name", "--help"])
+    assert result.exit_code == 0, (result.exit_code, result.output)
+    assert result.output.strip() == "a=1 name=--help"
@@ -11,7 +11,6 @@ import pytest
 from clapper.click import config_group
 from clapper.config import load, mod_to_context
 from clapper.logging import setup as logger_setup
-from click.testing import CliRunner
 
 
 def test_basic(datadir):
@@ -29,6 +28,16 @@ def test_empty():
     assert len(ctx) == 0
 
 
+def test_reload_modified(tmp_path):
+    config = tmp_path / "config.py"
+    config.write_text("a = 1\n")
+    assert load([config]).a == 1
+
+    # changed files are compiled again
+    config.write_text("a = 22\n")
+    assert load([config]).a == 22
+
+
 def test_basic_with_context(datadir):
     c = load([datadir / "basic_config.py"], {"d": 35, "a": 0})
     assert hasattr(c, "a") and c.a == 1
@@ -88,6 +97,16 @@ def test_config_not_found(datadir):
         load([datadir / "basic_config.pz"])
 
 
+def test_config_module_found_later(tmp_path, monkeypatch):
+    (tmp_path / "clapper_late_config.py").write_text("a = 7\n")
+    with pytest.raises(ValueError):
+        load(["clapper_late_config"])
+
+    # modules that become importable are found on later lookups
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert load(["clapper_late_config"]).a == 7
+
+
 def test_config_load_attribute():
     a = load(["tests.data.basic_config"], attribute_name="a")
     assert a == 1
@@ -116,29 +135,26 @@ def cli_messages():
     return (cli, messages)
 
 
-def test_config_click_config_list(cli_messages):
+def test_config_click_config_list(cli_runner, cli_messages):
     cli = cli_messages[0]
-    runner = CliRunner()
-    result = runner.invoke(cli, ["list"])
+    result = cli_runner.invoke(cli, ["list"])
     assert result.exit_code == 0
     assert result.output.startswith("module: tests.data")
     assert "(cannot be loaded; add another -v for details)" not in result.output
 
 
-def test_config_click_config_list_v(cli_messages):
+def test_config_click_config_list_v(cli_runner, cli_messages):
     cli = cli_messages[0]
-    runner = CliRunner()
-    result = runner.invoke(cli, ["list", "-v"])
+    result = cli_runner.invoke(cli, ["list", "-v"])
     assert result.exit_code == 0
     assert result.output.startswith("module: tests.data")
     assert "(cannot be loaded; add another -v for details)" in result.output
     assert "[module] Example configuration module" in result.output
 
 
-def test_config_click_config_list_vv(cli_messages):
+def test_config_click_config_list_vv(cli_runner, cli_messages):
     cli, messages = cli_messages
-    runner = CliRunner()
-    result = runner.invoke(cli, ["list", "-vv"])
+    result = cli_runner.invoke(cli, ["list", "-vv"])
     assert result.exit_code == 0
     assert result.output.startswith("module: tests.data")
     assert "(cannot be loaded; add another -v for details)" in result.output
@@ -146,10 +162,9 @@ def test_config_click_config_list_vv(cli_messages):
     assert "NameError" in messages.getvalue()
 
 
-def test_config_click_config_describe(cli_messages):
+def test_config_click_config_describe(cli_runner, cli_messages):
     cli = cli_messages[0]
-    runner = CliRunner()
-    result = runner.invoke(cli, ["describe", "first"])
+    result = cli_runner.invoke(cli, ["describe", "first"])
     assert result.exit_code == 0
     assert result.output.startswith("Configuration: first")
     assert "Example configuration module" in result.output
@@ -157,37 +172,33 @@ def test_config_click_config_describe(cli_messages):
     assert "b = a + 2" not in result.output
 
 
-def test_config_click_config_describe_v(cli_messages):
+def test_config_click_config_describe_v(cli_runner, cli_messages):
     cli = cli_messages[0]
-    runner = CliRunner()
-    result = runner.invoke(cli, ["describe", "first", "-v"])
+    result = cli_runner.invoke(cli, ["describe", "first", "-v"])
     assert result.exit_code == 0
     assert result.output.startswith("Configuration: first")
     assert "a = 1" in result.output
     assert "b = a + 2" in result.output
 
 
-def test_config_click_describe_error(cli_messages):
+def test_config_click_describe_error(cli_runner, cli_messages):
     cli, messages = cli_messages
-    runner = CliRunner()
-    result = runner.invoke(cli, ["describe", "not-found"])
+    result = cli_runner.invoke(cli, ["describe", "not-found"])
     assert result.exit_code == 0
     assert "Cannot find configuration resource `not-found'" in messages.getvalue()
 
 
-def test_config_click_copy(cli_messages, datadir, tmp_path):
+def test_config_click_copy(cli_runner, cli_messages, datadir, tmp_path):
     cli = cli_messages[0]
-    runner = CliRunner()
     dest = tmp_path / "file.py"
-    result = runner.invoke(cli, ["copy", "first", str(dest)])
+    result = cli_runner.invoke(cli, ["copy", "first", str(dest)])
     assert result.exit_code == 0
     assert filecmp.cmp(datadir / "basic_config.py", dest)
 
 
-def test_config_click_copy_error(cli_messages, datadir, tmp_path):
+def test_config_click_copy_error(cli_runner, cli_messages, datadir, tmp_path):
     cli, messages = cli_messages
-    runner = CliRunner()
     dest = tmp_path / "file.py"
-    result = runner.invoke(cli, ["copy", "firstx", str(dest)])
+    result = cli_runner.invoke(cli, ["copy", "firstx", str(dest)])
     assert result.exit_code == 0
     assert "[ERROR] Cannot find configuration resource `firstx'" in messages.getvalue()
@@ -10,7 +10,18 @@ import click
 import pytest
 
 from clapper.click import ConfigCommand, ResourceOption, verbosity_option
-from click.testing import CliRunner
+
+
+@pytest.fixture(autouse=True)
+def _reset_test_loggers():
+    """Detach handlers installed by each test on the shared test loggers.
+
+    Otherwise, handlers pile up (and keep receiving records) on the same
+    logger across tests.
+    """
+    yield
+    for name in ("awesome.logger", "awesome.twice", "clapper_test"):
+        logging.getLogger(name).handlers.clear()
 
 
 def test_logger_setup():
@@ -61,143 +72,38 @@ def test_logger_setup_formatter():
     )
 
 
-def test_logger_click_no_v():
+def test_logger_setup_twice():
     lo = io.StringIO()
     hi = io.StringIO()
 
     logger = clapper.logging.setup(
-        "awesome.logger",
+        "awesome.twice",
         format="%(message)s",
         low_level_stream=lo,
         high_level_stream=hi,
     )
+    handlers = list(logger.handlers)
 
-    @click.command()
-    @verbosity_option(logger=logger)
-    def cli(**_):
-        logger.debug("debug message")
-        logger.info("info message")
-        logger.warning("warning message")
-        logger.error("error message")
-
-    runner = CliRunner()
-    result = runner.invoke(cli, [])
-    assert result.exit_code == 0
-
-    assert lo.getvalue() == ""
-
-    assert hi.getvalue() == "error message\n"
-
-
-def test_logger_click_v():
-    lo = io.StringIO()
-    hi = io.StringIO()
-
-    logger = clapper.logging.setup(
-        "awesome.logger",
+    logger2 = clapper.logging.setup(
+        "awesome.twice",
         format="%(message)s",
         low_level_stream=lo,
         high_level_stream=hi,
     )
+    assert logger2 is logger
+    assert logger.handlers == handlers
 
-    @click.command()
-    @verbosity_option(logger=logger)
-    def cli(**_):
-        logger.debug("debug message")
-        logger.info("info message")
-        logger.warning("warning message")
-        logger.error("error message")
-
-    runner = CliRunner()
-    result = runner.invoke(cli, ["-v"])
-    assert result.exit_code == 0
-
-    assert lo.getvalue() == ""
-    assert hi.getvalue() == "warning message\nerror message\n"
-
-
-def test_logger_click_vv():
-    lo = io.StringIO()
-    hi = io.StringIO()
-
-    logger = clapper.logging.setup(
-        "awesome.logger",
-        format="%(message)s",
-        low_level_stream=lo,
-        high_level_stream=hi,
-    )
-
-    @click.command()
-    @verbosity_option(logger=logger)
-    def cli(**_):
-        logger.debug("debug message")
-        logger.info("info message")
-        logger.warning("warning message")
-        logger.error("error message")
-
-    runner = CliRunner()
-    result = runner.invoke(cli, ["-vv"])
-    assert result.exit_code == 0
+    logger.setLevel(logging.INFO)
+    logger.info("info message")
+    logger.error("error message")
 
     assert lo.getvalue() == "info message\n"
-    assert hi.getvalue() == "warning message\nerror message\n"
-
-
-def test_logger_click_vvv():
-    lo = io.StringIO()
-    hi = io.StringIO()
-
-    logger = clapper.logging.setup(
-        "awesome.logger",
-        format="%(message)s",
-        low_level_stream=lo,
-        high_level_stream=hi,
-    )
-
-    @click.command()
-    @verbosity_option(logger=logger)
-    def cli(**_):
-        logger.debug("debug message")
-        logger.info("info message")
-        logger.warning("warning message")
-        logger.error("error message")
-
-    runner = CliRunner()
-    result = runner.invoke(cli, ["-vvv"])
-    assert result.exit_code == 0
-
-    assert "debug message\ninfo message\n" in lo.getvalue()
-    assert hi.getvalue() == "warning message\nerror message\n"
-
-
-def test_logger_click_3x_verbose():
-    lo = io.StringIO()
-    hi = io.StringIO()
-
-    logger = clapper.logging.setup(
-        "awesome.logger",
-        format="%(message)s",
-        low_level_stream=lo,
-        high_level_stream=hi,
-    )
-
-    @click.command()
-    @verbosity_option(logger=logger)
-    def cli(**_):
-        logger.debug("debug message")
-        logger.info("info message")
-        logger.warning("warning message")
-        logger.error("error message")
-
-    runner = CliRunner()
-    result = runner.invoke(cli, 3 * ["--verbose"])
-    assert result.exit_code == 0
-
-    assert "debug message\ninfo message\n" in lo.getvalue()
-    assert hi.getvalue() == "warning message\nerror message\n"
+    assert hi.getvalue() == "error message\n"
 
 
-def test_logger_click_3x_verb():
+@pytest.fixture
+def awesome_logger():
+    """Logger writing bare messages to in-memory low/high level streams."""
     lo = io.StringIO()
     hi = io.StringIO()
 
@@ -207,36 +113,79 @@ def test_logger_click_3x_verb():
         low_level_stream=lo,
         high_level_stream=hi,
     )
+    # handlers of previous tests must have been detached
+    assert len(logger.handlers) == 2
+
+    return logger, lo, hi
+
+
+@pytest.mark.parametrize(
+    "args,name,lo_expected,hi_expected",
+    [
+        ([], None, "", "error message\n"),
+        (["-v"], None, "", "warning message\nerror message\n"),
+        (["-vv"], None, "info message\n", "warning message\nerror message\n"),
+        (
+            ["-vvv"],
+            None,
+            "debug message\ninfo message\n",
+            "warning message\nerror message\n",
+        ),
+        (
+            3 * ["--verbose"],
+            None,
+            "debug message\ninfo message\n",
+            "warning message\nerror message\n",
+        ),
+        (
+            3 * ["--verb"],
+            "verb",
+            "debug message\ninfo message\n",
+            "warning message\nerror message\n",
+        ),
+    ],
+    ids=["no_v", "v", "vv", "vvv", "3x_verbose", "3x_verb"],
+)
+def test_logger_click(cli_runner, awesome_logger, args, name, lo_expected, hi_expected):
+    logger, lo, hi = awesome_logger
+
+    kwargs = {} if name is None else {"name": name}
 
     @click.command()
-    @verbosity_option(logger=logger, name="verb")
+    @verbosity_option(logger=logger, **kwargs)
     def cli(**_):
         logger.debug("debug message")
         logger.info("info message")
         logger.warning("warning message")
         logger.error("error message")
 
-    runner = CliRunner()
-    result = runner.invoke(cli, 3 * ["--verb"])
+    result = cli_runner.invoke(cli, args)
     assert result.exit_code == 0
 
-    assert "debug message\ninfo message\n" in lo.getvalue()
-    assert hi.getvalue() == "warning message\nerror message\n"
+    if "debug message" in lo_expected:
+        # at debug level, clapper's own debug messages are also logged
+        assert lo_expected in lo.getvalue()
+    else:
+        assert lo.getvalue() == lo_expected
+    assert hi.getvalue() == hi_expected
 
 
 # Testing the logger is also set correctly during the loading of config files.
 
+_CONFIG_FORMATTER = logging.Formatter("[%(levelname)s] %(message)s")
+"""Formatter shared by the config-loading CLI fixtures below."""
+
 
 @pytest.fixture
 def cli_config():
     messages = io.StringIO()
     logger = clapper.logging.setup(
         "clapper_test",
-        format="[%(levelname)s] %(message)s",
+        formatter=_CONFIG_FORMATTER,
         low_level_stream=messages,
         high_level_stream=messages,
     )
-    logger.setLevel("ERROR")  # Enforce a default level
+    logger.setLevel(logging.ERROR)  # Enforce a default level
 
     @click.command(entry_point_group="clapper.test.config", cls=ConfigCommand)
     @click.option("--cmp", entry_point_group="clapper.test.config", cls=ResourceOption)
@@ -251,142 +200,77 @@ def cli_config():
     return (cli, messages)
 
 
-# Loading configs using ResourceOption
-
-
-def test_logger_click_option_config_q(cli_config):
-    cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var"])
-    expected = "[ERROR] Error level message\n" "[ERROR] App Error level message\n"
-    assert result.exit_code == 0, result.output
-    assert log_output.getvalue() == expected
-
-
-def test_logger_click_option_config_v(cli_config):
-    cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var", "-v"])
-    expected = (
-        "[WARNING] Warning level message\n"
-        "[ERROR] Error level message\n"
-        "[WARNING] App Warning level message\n"
-        "[ERROR] App Error level message\n"
-    )
-    assert result.exit_code == 0, result.output
-    assert log_output.getvalue() == expected
-
-
-def test_logger_click_option_config_vv(cli_config):
-    cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var", "-vv"])
-    expected = (
-        "[INFO] Info level message\n"
-        "[WARNING] Warning level message\n"
-        "[ERROR] Error level message\n"
-        "[INFO] App Info level message\n"
-        "[WARNING] App Warning level message\n"
-        "[ERROR] App Error level message\n"
-    )
-    assert result.exit_code == 0, result.output
-    assert log_output.getvalue() == expected
-
-
-def test_logger_click_option_config_vvv(cli_config):
-    cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var", "-vvv"])
-    expected = (
-        "[DEBUG] Debug level message\n"
-        "[INFO] Info level message\n"
-        "[WARNING] Warning level message\n"
-        "[ERROR] Error level message\n"
-        "[DEBUG] App Debug level message\n"
-        "[INFO] App Info level message\n"
-        "[WARNING] App Warning level message\n"
-        "[ERROR] App Error level message\n"
-    )
-    assert result.exit_code == 0, result.output
-    assert log_output.getvalue().endswith(expected)
-
-
-# Loading configs using ConfigCommand
-
-
-def test_logger_click_command_config_q(cli_config):
-    cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["complex"])
-    expected = "[ERROR] Error level message\n" "[ERROR] App Error level message\n"
-    assert result.exit_code == 0, result.output
-    assert log_output.getvalue() == expected
-
-
-def test_logger_click_command_config_v(cli_config):
-    cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["complex", "-v"])
-    expected = (
-        "[WARNING] Warning level message\n"
-        "[ERROR] Error level message\n"
-        "[WARNING] App Warning level message\n"
-        "[ERROR] App Error level message\n"
-    )
-    assert result.exit_code == 0, result.output
-    assert log_output.getvalue() == expected
-
-
-def test_logger_click_command_config_vv(cli_config):
+# Loading configs using ResourceOption (--cmp) or ConfigCommand (CONFIG)
+
+
+@pytest.mark.parametrize(
+    "config_args", [["--cmp", "complex-var"], ["complex"]], ids=["option", "command"]
+)
+@pytest.mark.parametrize(
+    "verbosity,expected",
+    [
+        ([], "[ERROR] Error level message\n[ERROR] App Error level message\n"),
+        (
+            ["-v"],
+            (
+                "[WARNING] Warning level message\n"
+                "[ERROR] Error level message\n"
+                "[WARNING] App Warning level message\n"
+                "[ERROR] App Error level message\n"
+            ),
+        ),
+        (
+            ["-vv"],
+            (
+                "[INFO] Info level message\n"
+                "[WARNING] Warning level message\n"
+                "[ERROR] Error level message\n"
+                "[INFO] App Info level message\n"
+                "[WARNING] App Warning level message\n"
+                "[ERROR] App Error level message\n"
+            ),
+        ),
+        (
+            ["-vvv"],
+            (
+                "[DEBUG] Debug level message\n"
+                "[INFO] Info level message\n"
+                "[WARNING] Warning level message\n"
+                "[ERROR] Error level message\n"
+                "[DEBUG] App Debug level message\n"
+                "[INFO] App Info level message\n"
+                "[WARNING] App Warning level message\n"
+                "[ERROR] App Error level message\n"
+            ),
+        ),
+    ],
+    ids=["q", "v", "vv", "vvv"],
+)
+def test_logger_click_config(cli_runner, cli_config, config_args, verbosity, expected):
     cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["complex", "-vv"])
-    expected = (
-        "[INFO] Info level message\n"
-        "[WARNING] Warning level message\n"
-        "[ERROR] Error level message\n"
-        "[INFO] App Info level message\n"
-        "[WARNING] App Warning level message\n"
-        "[ERROR] App Error level message\n"
-    )
-    assert result.exit_code == 0, result.output
-    assert log_output.getvalue() == expected
-
-
-def test_logger_click_command_config_vvv(cli_config):
-    cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["complex", "-vvv"])
-    expected = (
-        "[DEBUG] Debug level message\n"
-        "[INFO] Info level message\n"
-        "[WARNING] Warning level message\n"
-        "[ERROR] Error level message\n"
-        "[DEBUG] App Debug level message\n"
-        "[INFO] App Info level message\n"
-        "[WARNING] App Warning level message\n"
-        "[ERROR] App Error level message\n"
-    )
+    result = cli_runner.invoke(cli, config_args + verbosity)
     assert result.exit_code == 0, result.output
-    assert log_output.getvalue().endswith(expected)
+    if verbosity == ["-vvv"]:
+        # at debug level, clapper's own debug messages are also logged
+        assert log_output.getvalue().endswith(expected)
+    else:
+        assert log_output.getvalue() == expected
 
 
 # Verbosity option set in config file is ignored (not a ResourceOption)
 
 
-def test_logger_click_command_config_q_plus_config(cli_config):
+def test_logger_click_command_config_q_plus_config(cli_runner, cli_config):
     cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["verbose-config", "complex"])
+    result = cli_runner.invoke(cli, ["verbose-config", "complex"])
     expected = "[ERROR] Error level message\n" "[ERROR] App Error level message\n"
     assert result.exit_code == 0, result.output
     assert log_output.getvalue() == expected
 
 
-def test_logger_click_command_config_v_plus_config(cli_config):
+def test_logger_click_command_config_v_plus_config(cli_runner, cli_config):
     cli, log_output = cli_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["verbose-config", "complex", "-v"])
+    result = cli_runner.invoke(cli, ["verbose-config", "complex", "-v"])
     expected = (
         "[WARNING] Warning level message\n"
         "[ERROR] Error level message\n"
@@ -406,11 +290,11 @@ def cli_verbosity_config():
     messages = io.StringIO()
     logger = clapper.logging.setup(
         "clapper_test",
-        format="[%(levelname)s] %(message)s",
+        formatter=_CONFIG_FORMATTER,
         low_level_stream=messages,
         high_level_stream=messages,
     )
-    logger.setLevel("ERROR")  # Enforce a default level
+    logger.setLevel(logging.ERROR)  # Enforce a default level
 
     @click.command(entry_point_group="clapper.test.config", cls=ConfigCommand)
     @click.option("--cmp", entry_point_group="clapper.test.config", cls=ResourceOption)
@@ -425,19 +309,21 @@ def cli_verbosity_config():
     return (cli, messages)
 
 
-def test_logger_click_option_config_verbose_as_config_q(cli_verbosity_config):
+def test_logger_click_option_config_verbose_as_config_q(
+    cli_runner, cli_verbosity_config
+):
     cli, log_output = cli_verbosity_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var"])
+    result = cli_runner.invoke(cli, ["--cmp", "complex-var"])
     expected = "[ERROR] Error level message\n" "[ERROR] App Error level message\n"
     assert result.exit_code == 0, result.output
     assert log_output.getvalue() == expected
 
 
-def test_logger_click_option_config_verbose_as_config_v(cli_verbosity_config):
+def test_logger_click_option_config_verbose_as_config_v(
+    cli_runner, cli_verbosity_config
+):
     cli, log_output = cli_verbosity_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var", "-v"])
+    result = cli_runner.invoke(cli, ["--cmp", "complex-var", "-v"])
     expected = (
         "[ERROR] Error level message\n"
         "[WARNING] App Warning level message\n"
@@ -447,10 +333,11 @@ def test_logger_click_option_config_verbose_as_config_v(cli_verbosity_config):
     assert log_output.getvalue() == expected
 
 
-def test_logger_click_option_config_verbose_as_config_vv(cli_verbosity_config):
+def test_logger_click_option_config_verbose_as_config_vv(
+    cli_runner, cli_verbosity_config
+):
     cli, log_output = cli_verbosity_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var", "-vv"])
+    result = cli_runner.invoke(cli, ["--cmp", "complex-var", "-vv"])
     expected = (
         "[ERROR] Error level message\n"
         "[INFO] App Info level message\n"
@@ -461,10 +348,11 @@ def test_logger_click_option_config_verbose_as_config_vv(cli_verbosity_config):
     assert log_output.getvalue() == expected
 
 
-def test_logger_click_option_config_verbose_as_config_vvv(cli_verbosity_config):
+def test_logger_click_option_config_verbose_as_config_vvv(
+    cli_runner, cli_verbosity_config
+):
     cli, log_output = cli_verbosity_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--cmp", "complex-var", "-vvv"])
+    result = cli_runner.invoke(cli, ["--cmp", "complex-var", "-vvv"])
     expected_start = "[ERROR] Error level message\n"
     expected_end = (
         "[DEBUG] App Debug level message\n"
@@ -481,10 +369,11 @@ def test_logger_click_option_config_verbose_as_config_vvv(cli_verbosity_config):
 # Verbosity option set in config file is handled (verbosity_option is a ResourceOption)
 
 
-def test_logger_option_config_verbose_as_config_q_plus_config(cli_verbosity_config):
+def test_logger_option_config_verbose_as_config_q_plus_config(
+    cli_runner, cli_verbosity_config
+):
     cli, log_output = cli_verbosity_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["verbose-config", "complex"])
+    result = cli_runner.invoke(cli, ["verbose-config", "complex"])
     expected = (
         "[ERROR] Error level message\n"
         "[INFO] App Info level message\n"
@@ -498,10 +387,11 @@ def test_logger_option_config_verbose_as_config_q_plus_config(cli_verbosity_conf
 # specifying the verbosity option in the CLI overrides the option
 
 
-def test_logger_option_config_verbose_as_config_v_plus_config(cli_verbosity_config):
+def test_logger_option_config_verbose_as_config_v_plus_config(
+    cli_runner, cli_verbosity_config
+):
     cli, log_output = cli_verbosity_config
-    runner = CliRunner()
-    result = runner.invoke(cli, ["verbose-config", "complex", "-v"])
+    result = cli_runner.invoke(cli, ["verbose-config", "complex", "-v"])
     expected = (
         "[ERROR] Error level message\n"
         "[WARNING] App Warning level message\n"
@@ -6,14 +6,13 @@
 import filecmp
 import logging
 import os
-import pathlib
 import shutil
+import stat
 
 import pytest
 
 from clapper.click import user_defaults_group
 from clapper.rc import UserDefaults
-from click.testing import CliRunner
 
 
 def _check_userdefaults_ex1_contents(rc):
@@ -63,29 +62,32 @@ def _check_tree(d, sect, var, val):
     assert d[sect][var] == val
 
 
+_SECTION1 = {
+    "an_int": 15,
+    "a_bool": True,
+    "a_float": 3.1415,
+    "baz": "fun",
+    "bar": "Python",
+}
+
+
+def _check_section1(rc):
+    # checks both the nested and the dotted ways to access variables (types
+    # are also checked, so that True is not confused with 1)
+    for var, val in _SECTION1.items():
+        for found in (rc["section1"][var], rc[f"section1.{var}"]):
+            assert (type(found), found) == (type(val), val)
+
+
 def test_rc_write(tmp_path):
     rc = UserDefaults(tmp_path / "new-rc")
     assert not rc
 
-    rc["section1.an_int"] = 15
-    rc["section1.a_bool"] = True
-    rc["section1.a_float"] = 3.1415
-    rc["section1.baz"] = "fun"
-    rc["section1.bar"] = "Python"
+    for var, val in _SECTION1.items():
+        rc[f"section1.{var}"] = val
 
     # checks contents before writing
-    assert rc["section1"]["an_int"] == 15
-    assert rc["section1"]["a_bool"] is True
-    assert rc["section1"]["a_float"] == 3.1415
-    assert rc["section1"]["baz"] == "fun"
-    assert rc["section1"]["bar"] == "Python"
-
-    # checks contents before writing - different way
-    assert rc["section1.an_int"] == 15
-    assert rc["section1.a_bool"] is True
-    assert rc["section1.a_float"] == 3.1415
-    assert rc["section1.baz"] == "fun"
-    assert rc["section1.bar"] == "Python"
+    _check_section1(rc)
 
     rc.write()
 
@@ -93,33 +95,25 @@ def test_rc_write(tmp_path):
 
     rc2 = UserDefaults(tmp_path / "new-rc")
     assert len(rc2) == 1
-    assert rc["section1"]["an_int"] == 15
-    assert rc["section1.an_int"] == 15
-    assert rc["section1"]["a_bool"] is True
-    assert rc["section1.a_bool"] is True
-    assert rc["section1"]["a_float"] == 3.1415
-    assert rc["section1.a_float"] == 3.1415
-    assert rc["section1"]["baz"] == "fun"
-    assert rc["section1.baz"] == "fun"
-    assert rc["section1"]["bar"] == "Python"
-    assert rc["section1.bar"] == "Python"
+    _check_section1(rc2)
 
 
 def test_rc_delete(tmp_path):
     rc = UserDefaults(tmp_path / "new-rc")
     assert not rc
 
-    rc["an_int"] = 15
-    rc["a_bool"] = True
-    rc["a_float"] = 3.1415
-    rc["section1.baz"] = "fun"
-    rc["section1.bar"] = "Python"
+    values = {
+        "an_int": 15,
+        "a_bool": True,
+        "a_float": 3.1415,
+        "section1.baz": "fun",
+        "section1.bar": "Python",
+    }
+    for key, val in values.items():
+        rc[key] = val
 
-    assert rc["an_int"] == 15
-    assert rc["a_bool"] is True
-    assert rc["a_float"] == 3.1415
-    assert rc["section1.baz"] == "fun"
-    assert rc["section1.bar"] == "Python"
+    for key, val in values.items():
+        assert (type(rc[key]), rc[key]) == (type(val), val)
 
     # delete something that exists
     del rc["an_int"]
@@ -147,18 +141,37 @@ def test_rc_backup_on_write(tmp_path):
     assert (tmp_path / "new-rc").exists()
     assert (tmp_path / "new-rc~").exists()
 
-    assert filecmp.cmp(tmp_path / "new-rc", tmp_path / "new-rc~")
+    assert filecmp.cmp(tmp_path / "new-rc", tmp_path / "new-rc~", shallow=False)
+
+    # no temporary files are left behind
+    assert sorted(k.name for k in tmp_path.iterdir()) == ["new-rc", "new-rc~"]
+
 
+def test_rc_write_file_mode(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        rc = UserDefaults(tmp_path / "new-rc")
+        rc["an_int"] = 15
+        rc.write()
+    finally:
+        os.umask(umask)
+
+    # new files are not private to the user, as temporary files are
+    assert stat.S_IMODE((tmp_path / "new-rc").stat().st_mode) == 0o644
 
-def test_rc_clear():
+
+def test_rc_clear(tmp_path, monkeypatch):
+    # relative paths resolve under XDG_CONFIG_HOME: keep it off the user's
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
     rc = UserDefaults("does-not-exist")
+    assert rc.path == tmp_path / "does-not-exist"
     assert not rc
 
     rc["section2.another_int"] = 42
     rc.clear()
 
     assert not rc
-    assert not pathlib.Path("does-not-exist").exists()
+    assert not rc.path.exists()
 
 
 def test_rc_reload(tmp_path):
@@ -180,6 +193,30 @@ def test_rc_reload(tmp_path):
     assert rc2["section2"]["another_int"] == 42
 
 
+def test_rc_read_cached(tmp_path):
+    rc = UserDefaults(tmp_path / "new-rc", cache=True)
+    rc["section1.an_int"] = 15
+    rc.write()
+
+    rc.read()
+    assert rc["section1.an_int"] == 15
+
+    # in-memory changes are still replaced by the file contents
+    rc["section1.an_int"] = 20
+    rc.read()
+    assert rc["section1.an_int"] == 15
+
+    # other objects with caching enabled see the same contents
+    rc2 = UserDefaults(tmp_path / "new-rc", cache=True)
+    assert rc2["section1.an_int"] == 15
+    rc2["section1.an_int"] = 42
+    rc2.write()
+
+    # changes to the file are read back
+    rc.read()
+    assert rc["section1.an_int"] == 42
+
+
 def test_rc_str(tmp_path):
     rc = UserDefaults(tmp_path / "new-rc")
     rc["foo"] = "bar"
@@ -190,7 +227,7 @@ def test_rc_str(tmp_path):
 
 
 def test_rc_json_legacy(datadir, tmp_path):
-    shutil.copy(datadir / "oldjson.cfg", tmp_path)
+    shutil.copyfile(datadir / "oldjson.cfg", tmp_path / "oldjson.cfg")
     rc = UserDefaults(tmp_path / "oldjson.cfg")
 
     assert rc["string"] == "this is a string"
@@ -200,8 +237,8 @@ def test_rc_json_legacy(datadir, tmp_path):
     assert rc["baz"]["foo"]["int"] == 35
 
 
-def test_rc_click_loading(datadir):
-    # tests if we can simply read an RC file
+@pytest.fixture
+def cli_ex1(datadir):
     rc = UserDefaults(datadir / "userdefaults_ex1.cfg")
     logger = logging.getLogger("test-click-loading")
 
@@ -210,38 +247,43 @@ def test_rc_click_loading(datadir):
         """This is the documentation provided by the user."""
         pass
 
-    runner = CliRunner()
+    return cli, rc
 
-    # test "show"
-    result = runner.invoke(cli, ["show"])
-    assert result.exit_code == 0
-    assert result.output.strip() == str(rc).strip()
 
-    # test "get"
-    result = runner.invoke(cli, ["get", "string"])
+def test_rc_click_show(cli_runner, cli_ex1):
+    # tests if we can simply read an RC file
+    cli, rc = cli_ex1
+    result = cli_runner.invoke(cli, ["show"])
     assert result.exit_code == 0
-    assert result.output.strip() == "this is a string"
+    assert result.output.strip() == str(rc).strip()
 
-    result = runner.invoke(cli, ["get", "bar.boolean"])
-    assert result.exit_code == 0
-    assert result.output.strip() == "False"
 
-    result = runner.invoke(cli, ["get", "bar"])
+@pytest.mark.parametrize(
+    "key,expected",
+    [
+        ("string", "this is a string"),
+        ("bar.boolean", "False"),
+        ("bar", "{'boolean': False}"),
+    ],
+)
+def test_rc_click_get(cli_runner, cli_ex1, key, expected):
+    cli, _ = cli_ex1
+    result = cli_runner.invoke(cli, ["get", key])
     assert result.exit_code == 0
-    assert result.output.strip() == "{'boolean': False}"
+    assert result.output.strip() == expected
 
-    result = runner.invoke(cli, ["get", "wrong.wrong"])
-    assert result.exit_code != 0
-    assert "Error: Cannot find object named `wrong.wrong'" in result.output
 
-    result = runner.invoke(cli, ["get", "bar.wrong"])
+@pytest.mark.parametrize("key", ["wrong.wrong", "bar.wrong"])
+def test_rc_click_get_missing(cli_runner, cli_ex1, key):
+    cli, _ = cli_ex1
+    result = cli_runner.invoke(cli, ["get", key])
     assert result.exit_code != 0
-    assert "Error: Cannot find object named `bar.wrong'" in result.output
+    assert f"Error: Cannot find object named `{key}'" in result.output
 
 
-def test_rc_click_writing(datadir, tmp_path):
+def test_rc_click_writing(cli_runner, datadir, tmp_path):
     # let's copy the user defaults to a temporary file so we can change it
-    shutil.copy(datadir / "userdefaults_ex1.cfg", tmp_path)
+    shutil.copyfile(datadir / "userdefaults_ex1.cfg", tmp_path / "userdefaults_ex1.cfg")
 
     rc = UserDefaults(tmp_path / "userdefaults_ex1.cfg")
     logger = logging.getLogger("test-click-writing")
@@ -251,43 +293,58 @@ def test_rc_click_writing(datadir, tmp_path):
         """This is the documentation provided by the user."""
         pass
 
-    runner = CliRunner()
-
-    result = runner.invoke(cli, ["set", "string", "a different string"])
-    result = runner.invoke(cli, ["get", "bar.boolean"])
+    result = cli_runner.invoke(cli, ["set", "string", "a different string"])
+    assert result.exit_code == 0, result.output
+    result = cli_runner.invoke(cli, ["get", "bar.boolean"])
     assert result.exit_code == 0
     assert result.output.strip() == "False"
 
-    result = runner.invoke(cli, ["set", "bar.boolean", "true"])
-    result = runner.invoke(cli, ["get", "bar.boolean"])
+    result = cli_runner.invoke(cli, ["set", "bar.boolean", "true"])
+    assert result.exit_code == 0, result.output
+    result = cli_runner.invoke(cli, ["get", "bar.boolean"])
     assert result.exit_code == 0
     assert result.output.strip() == "True"
 
-    result = runner.invoke(cli, ["set", "new-section.date", "2022-02-02"])
-    result = runner.invoke(cli, ["get", "new-section.date"])
+    result = cli_runner.invoke(cli, ["set", "new-section.int", "15"])
+    assert result.exit_code == 0
+    assert rc["new-section.int"] == 15
+
+    result = cli_runner.invoke(cli, ["set", "new-section.float", "2.5e-3"])
+    assert result.exit_code == 0
+    assert rc["new-section.float"] == 2.5e-3
+
+    result = cli_runner.invoke(cli, ["set", "new-section.string", "True"])
+    assert result.exit_code == 0
+    assert rc["new-section.string"] == "True"
+
+    result = cli_runner.invoke(cli, ["set", "new-section.date", "2022-02-02"])
+    assert result.exit_code == 0, result.output
+    result = cli_runner.invoke(cli, ["get", "new-section.date"])
     assert result.exit_code == 0
     assert result.output.strip() == "2022-02-02"
 
-    result = runner.invoke(cli, ["rm", "new-section.date"])
-    result = runner.invoke(cli, ["get", "new-section.date"])
+    result = cli_runner.invoke(cli, ["rm", "new-section.date"])
+    assert result.exit_code == 0, result.output
+    result = cli_runner.invoke(cli, ["get", "new-section.date"])
     assert result.exit_code != 0
     assert "Error: Cannot find object named `new-section.date'" in result.output
 
-    result = runner.invoke(cli, ["rm", "new-section"])
-    result = runner.invoke(cli, ["get", "new-section"])
+    result = cli_runner.invoke(cli, ["rm", "new-section"])
+    assert result.exit_code == 0, result.output
+    result = cli_runner.invoke(cli, ["get", "new-section"])
     assert result.exit_code != 0
     assert "Error: Cannot find object named `new-section'" in result.output
 
-    result = runner.invoke(cli, ["rm", "bar"])
+    result = cli_runner.invoke(cli, ["rm", "bar"])
     assert result.exit_code == 0
-    result = runner.invoke(cli, ["get", "bar"])
+    result = cli_runner.invoke(cli, ["get", "bar"])
     assert result.exit_code != 0
     assert "Error: Cannot find object named `bar'" in result.output
 
 
-def test_rc_click_no_directory(datadir, tmp_path):
+def test_rc_click_no_directory(cli_runner, datadir, tmp_path):
     # artificially removes surrounding directory to create an error
-    shutil.copy(datadir / "userdefaults_ex1.cfg", tmp_path)
+    shutil.copyfile(datadir / "userdefaults_ex1.cfg", tmp_path / "userdefaults_ex1.cfg")
 
     rc = UserDefaults(tmp_path / "userdefaults_ex1.cfg")
     logger = logging.getLogger("test-click-writing")
@@ -297,15 +354,13 @@ def test_rc_click_no_directory(datadir, tmp_path):
         """This is the documentation provided by the user."""
         pass
 
-    runner = CliRunner()
-
     shutil.rmtree(tmp_path)
-    result = runner.invoke(cli, ["set", "color", "purple"])
+    result = cli_runner.invoke(cli, ["set", "color", "purple"])
     assert result.exit_code != 0
     assert isinstance(result.exception, FileNotFoundError)
 
 
-def test_rc_click_cannot_set(tmp_path):
+def test_rc_click_cannot_set(cli_runner, tmp_path):
     rc = UserDefaults(tmp_path / "test.toml")
     logger = logging.getLogger("test-click-cannot-set")
 
@@ -314,20 +369,19 @@ def test_rc_click_cannot_set(tmp_path):
         """This is the documentation provided by the user."""
         pass
 
-    runner = CliRunner()
-
-    result = runner.invoke(cli, ["set", "string", "a different string"])
-    result = runner.invoke(cli, ["set", "bar.boolean", "true"])
+    result = cli_runner.invoke(cli, ["set", "string", "a different string"])
+    assert result.exit_code == 0, result.output
+    result = cli_runner.invoke(cli, ["set", "bar.boolean", "true"])
     assert result.exit_code == 0
 
     assert (tmp_path / "test.toml").exists()
 
-    result = runner.invoke(cli, ["set", "bar.boolean.error", "50"])
+    result = cli_runner.invoke(cli, ["set", "bar.boolean.error", "50"])
     assert result.exit_code != 0
     assert "Error: Cannot set object named `bar.boolean.error'" in result.output
 
 
-def test_rc_click_cannot_delete(tmp_path):
+def test_rc_click_cannot_delete(cli_runner, tmp_path):
     rc = UserDefaults(tmp_path / "test.toml")
     logger = logging.getLogger("test-click-cannot-delete")
 
@@ -336,18 +390,17 @@ def test_rc_click_cannot_delete(tmp_path):
         """This is the documentation provided by the user."""
         pass
 
-    runner = CliRunner()
-
-    result = runner.invoke(cli, ["set", "string", "a different string"])
-    result = runner.invoke(cli, ["set", "bar.boolean", "true"])
+    result = cli_runner.invoke(cli, ["set", "string", "a different string"])
+    assert result.exit_code == 0, result.output
+    result = cli_runner.invoke(cli, ["set", "bar.boolean", "true"])
     assert result.exit_code == 0
 
     assert (tmp_path / "test.toml").exists()
 
-    result = runner.invoke(cli, ["rm", "new-section"])
+    result = cli_runner.invoke(cli, ["rm", "new-section"])
     assert result.exit_code != 0
     assert "Error: Cannot delete object named `new-section'" in result.output
 
     # the existing section should still work
-    result = runner.invoke(cli, ["rm", "bar"])
+    result = cli_runner.invoke(cli, ["rm", "bar"])
     assert result.exit_code == 0